@@ -16,6 +16,7 @@ from datetime import timedelta
 
 # Flask core imports
 from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS  # Cross-Origin Resource Sharing
 from flask_pymongo import PyMongo  # MongoDB integration
 from flask_jwt_extended import JWTManager  # JWT authentication
@@ -24,6 +25,25 @@ from flask_socketio import SocketIO  # Real-time WebSocket support
 # Import configuration
 from .config import Config
 
+# orjson is optional but serializes the large nested responses
+# (job lists, skills, ATS breakdowns) several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        # orjson natively handles datetime; fall back to Flask's default
+        # hook for anything else it doesn't know (e.g. ObjectId via str)
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # ==============================================
 # Initialize Flask Extensions (without app binding)
 # ==============================================
@@ -68,6 +88,10 @@ def create_app(config_class=Config):
     # Load configuration from the config class
     # This sets up database URI, secret keys, etc.
     app.config.from_object(config_class)
+
+    # Use orjson for response serialization when available
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
     
     # Configure logging
     import logging
@@ -85,6 +109,28 @@ def create_app(config_class=Config):
     # Initialize MongoDB connection
     # PyMongo uses MONGO_URI from config to connect to database
     mongo.init_app(app)
+
+    # ==============================================
+    # MongoDB Indexes
+    # ==============================================
+
+    # Compound indexes matching the hot query shapes, so user-scoped
+    # lookups stay O(log N) instead of collection scans as data grows.
+    # create_index is a no-op when the index already exists.
+    with app.app_context():
+        try:
+            mongo.db.resumes.create_index([('user_id', 1), ('upload_date', -1)])
+            mongo.db.resumes.create_index([('user_id', 1), ('is_active', 1)])
+            mongo.db.resumes.create_index([('user_id', 1), ('content_hash', 1)])
+            mongo.db.resumes.create_index([('user_id', 1), ('analyzed', 1), ('analysis_date', -1)])
+            mongo.db.analysis_results.create_index([('resume_id', 1), ('user_id', 1)], unique=True)
+            mongo.db.ats_results.create_index([('resume_id', 1), ('user_id', 1)], unique=True)
+            mongo.db.skill_analysis.create_index([('resume_id', 1), ('user_id', 1)], unique=True)
+            mongo.db.ats_resumes.create_index([('resume_id', 1), ('user_id', 1)])
+            mongo.db.saved_jobs.create_index([('user_id', 1), ('job_id', 1)])
+            mongo.db.job_recommendations.create_index([('user_id', 1), ('job_id', 1)], unique=True)
+        except Exception as e:
+            print(f"WARNING: Failed to create MongoDB indexes: {str(e)}")
     
     # Initialize JWT Manager
     # Sets up token creation and verification
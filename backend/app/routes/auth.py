@@ -94,12 +94,14 @@ def register():
     mongo.db.users.insert_one(user.to_dict(include_password=True))
     
     # Create JWT tokens
+    # name/email ride along as claims so routes that stamp metadata on
+    # documents don't need a users lookup per request
     access_token = create_access_token(
         identity=str(user._id),
-        additional_claims={'role': user.role}
+        additional_claims={'role': user.role, 'name': user.name, 'email': user.email}
     )
     refresh_token = create_refresh_token(identity=str(user._id))
-    
+
     return jsonify({
         'success': True,
         'message': 'User registered successfully',
@@ -170,7 +172,8 @@ def login():
         # Create JWT tokens for demo
         access_token = create_access_token(
             identity=DEMO_USER_ID,
-            additional_claims={'role': 'admin'}
+            additional_claims={'role': 'admin', 'name': 'Demo User',
+                               'email': 'demo@example.com'}
         )
         refresh_token = create_refresh_token(identity=DEMO_USER_ID)
         
@@ -211,10 +214,10 @@ def login():
     # Create JWT tokens
     access_token = create_access_token(
         identity=str(user._id),
-        additional_claims={'role': user.role}
+        additional_claims={'role': user.role, 'name': user.name, 'email': user.email}
     )
     refresh_token = create_refresh_token(identity=str(user._id))
-    
+
     return jsonify({
         'success': True,
         'message': 'Login successful',
@@ -276,7 +279,7 @@ def refresh():
     # Create new access token
     access_token = create_access_token(
         identity=str(user._id),
-        additional_claims={'role': user.role}
+        additional_claims={'role': user.role, 'name': user.name, 'email': user.email}
     )
     
     return jsonify({
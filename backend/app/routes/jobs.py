@@ -4,10 +4,14 @@ Real Job Recommendations using Adzuna API
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict
 
+import numpy as np
+from bson import ObjectId
 from flask import Blueprint, request, jsonify
+from pymongo import UpdateOne
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_socketio import emit, join_room, leave_room
 
@@ -17,72 +21,224 @@ from app.services.nlp_analyzer import nlp_analyzer
 
 jobs_bp = Blueprint('jobs', __name__)
 
+# Shared executor for overlapping the Adzuna HTTP call with local work.
+# The network round-trip is independent of everything after the resume fetch,
+# so it can run in the background while we prepare the scoring inputs.
+_fetch_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _persist_recommendations(user_id, formatted_jobs, user_name):
+    """
+    Save recommended jobs for admin tracking in a single bulk upsert.
+
+    Runs as a background task so the Mongo write never sits on the
+    user-visible response path.
+    """
+    ops = [
+        UpdateOne(
+            {'user_id': user_id, 'job_id': job['id']},
+            {'$set': {
+                'user_id': user_id,
+                'user_name': user_name,
+                'job_id': job['id'],
+                'title': job['title'],
+                'company': job['company'],
+                'match_score': job['match_score'],
+                'recommended_at': datetime.utcnow()
+            }},
+            upsert=True
+        )
+        for job in formatted_jobs
+    ]
+
+    if not ops:
+        return
+
+    try:
+        mongo.db.job_recommendations.bulk_write(ops, ordered=False)
+    except Exception as e:
+        print(f"ERROR: Failed to save recommendations: {str(e)}")
+
+    # Counter-cache the recommended ids inline on the user document so
+    # later features can read them with one lookup instead of N
+    try:
+        mongo.db.users.update_one(
+            {'_id': ObjectId(user_id)},
+            {
+                '$addToSet': {
+                    'recommended_job_ids': {'$each': [job['id'] for job in formatted_jobs]}
+                },
+                '$set': {'last_recommended_at': datetime.utcnow()}
+            }
+        )
+    except Exception as e:
+        print(f"ERROR: Failed to update user recommendation cache: {str(e)}")
+
 
 # =====================================================
 # MATCH SCORE CALCULATION
 # =====================================================
 
-def calculate_job_match_score(resume_analysis: Dict, job: Dict) -> int:
+def build_candidate_profile(resume_analysis: Dict) -> Dict:
+    """
+    Precompute the candidate-side scoring inputs once per request.
+
+    The normalized skill set, experience years, education level, and the
+    skills text used for similarity never change between jobs, so they are
+    hoisted out of the per-job scoring loop.
+    """
+    user_skills = set()
+    for cat in resume_analysis.get('skills', {}).values():
+        user_skills.update(s.lower() for s in cat.get('skills', []))
+
+    return {
+        'skills': user_skills,
+        # Use skills as keyword proxy if content not available
+        'skills_text': " ".join(user_skills),
+        'years_experience': float(resume_analysis.get('total_years_experience', 0)),
+        'education_level': int(resume_analysis.get('education_level_score', 0))
+    }
+
+
+def calculate_job_match_score(resume_analysis: Dict, job: Dict, candidate: Dict = None) -> int:
     """
     Calculate weighted match score between resume analysis and job description.
     Formula: Skills (50%) + Experience (25%) + Education (15%) + Similarity (10%)
+
+    Pass a prebuilt `candidate` profile (from build_candidate_profile) when
+    scoring many jobs so the candidate-side work is done only once.
     """
+    if candidate is None:
+        candidate = build_candidate_profile(resume_analysis)
+
     job_title = job.get("title", "").lower()
     job_desc = job.get("description", "").lower()
     job_full_text = f"{job_title} {job_desc}"
-    
+
     # 1. Skills Match (50%)
     job_skills_data = nlp_analyzer.extract_skills(job_full_text)
     job_skills = set()
     for cat in job_skills_data.values():
         job_skills.update(s.lower() for s in cat.get('skills', []))
-    
-    user_skills = set()
-    for cat in resume_analysis.get('skills', {}).values():
-        user_skills.update(s.lower() for s in cat.get('skills', []))
-        
+
+    user_skills = candidate['skills']
+
     skill_score = 0
     if job_skills:
         matched_skills = user_skills & job_skills
         skill_score = (len(matched_skills) / len(job_skills)) * 100
     else:
         # Fallback if no skills in job desc
-        skill_score = 70 
-    
+        skill_score = 70
+
     # 2. Experience Match (25%)
     # Try to extract required years from job desc
     req_years_matches = re.findall(r'(\d+)\+?\s*years?', job_full_text)
     req_years = float(max([int(y) for y in req_years_matches])) if req_years_matches else 2.0
-    
-    user_years = float(resume_analysis.get('total_years_experience', 0))
+
+    user_years = candidate['years_experience']
     if user_years >= req_years:
         exp_score = 100
     else:
         exp_score = (user_years / req_years) * 100 if req_years > 0 else 100
-    
+
     # 3. Education Match (15%)
     # Simple heuristic for job education level
     job_edu_level = 3 # Bachelor default
     if any(kw in job_full_text for kw in ['phd', 'doctorate']): job_edu_level = 5
     elif any(kw in job_full_text for kw in ['master', 'mtech', 'ms']): job_edu_level = 4
-    
-    user_edu_level = int(resume_analysis.get('education_level_score', 0))
+
+    user_edu_level = candidate['education_level']
     if user_edu_level >= job_edu_level:
         edu_score = 100
     else:
         edu_score = (user_edu_level / job_edu_level) * 100 if job_edu_level > 0 else 100
-        
+
     # 4. Keyword Similarity (10%)
-    resume_text = " ".join(user_skills) # Use skills as keyword proxy if content not available
-    similarity = nlp_analyzer.get_similarity(resume_text, job_full_text)
+    similarity = nlp_analyzer.get_similarity(candidate['skills_text'], job_full_text)
     sim_score = similarity * 100
-    
+
     # Final Weighted Score
     final_score = (skill_score * 0.50) + (exp_score * 0.25) + (edu_score * 0.15) + (sim_score * 0.10)
-    
+
     return min(100, int(final_score))
 
 
+def score_jobs_batch(resume_analysis: Dict, jobs: List[Dict]) -> List[int]:
+    """
+    Score all jobs against the candidate in one vectorized pass.
+
+    Same formula as calculate_job_match_score, but the skill overlap,
+    experience, and education components are computed with NumPy set math
+    over a shared skill vocabulary instead of a per-job Python loop.
+    Only the job-side NLP extraction and the similarity call remain per-job.
+    """
+    candidate = build_candidate_profile(resume_analysis)
+    user_skills = candidate['skills']
+
+    # Per-job extraction pass (NLP-bound, cannot be vectorized)
+    job_skill_sets = []
+    req_years_arr = np.empty(len(jobs))
+    job_edu_arr = np.empty(len(jobs))
+    sim_arr = np.empty(len(jobs))
+
+    for i, job in enumerate(jobs):
+        job_full_text = f"{job.get('title', '').lower()} {job.get('description', '').lower()}"
+
+        job_skills_data = nlp_analyzer.extract_skills(job_full_text)
+        job_skills = set()
+        for cat in job_skills_data.values():
+            job_skills.update(s.lower() for s in cat.get('skills', []))
+        job_skill_sets.append(job_skills)
+
+        req_years_matches = re.findall(r'(\d+)\+?\s*years?', job_full_text)
+        req_years_arr[i] = float(max(int(y) for y in req_years_matches)) if req_years_matches else 2.0
+
+        job_edu_level = 3  # Bachelor default
+        if any(kw in job_full_text for kw in ['phd', 'doctorate']): job_edu_level = 5
+        elif any(kw in job_full_text for kw in ['master', 'mtech', 'ms']): job_edu_level = 4
+        job_edu_arr[i] = job_edu_level
+
+        sim_arr[i] = nlp_analyzer.get_similarity(candidate['skills_text'], job_full_text)
+
+    # Skills Match (50%): encode candidate and jobs as bit-vectors over the
+    # vocabulary seen this request, then compute all overlaps with one matmul
+    vocab = {skill: idx for idx, skill in enumerate(sorted(user_skills.union(*job_skill_sets) if job_skill_sets else user_skills))}
+
+    cand_vec = np.zeros(len(vocab), dtype=np.uint8)
+    if user_skills:
+        cand_vec[[vocab[s] for s in user_skills]] = 1
+
+    job_matrix = np.zeros((len(jobs), len(vocab)), dtype=np.uint8)
+    for i, skills in enumerate(job_skill_sets):
+        if skills:
+            job_matrix[i, [vocab[s] for s in skills]] = 1
+
+    job_counts = job_matrix.sum(axis=1)
+    intersections = job_matrix @ cand_vec.astype(np.int64)
+    # Fallback score of 70 when the job description yields no skills
+    skill_scores = np.where(job_counts > 0,
+                            intersections / np.maximum(job_counts, 1) * 100,
+                            70.0)
+
+    # Experience Match (25%)
+    exp_scores = np.where(
+        req_years_arr > 0,
+        np.minimum(candidate['years_experience'] / np.maximum(req_years_arr, 1e-9), 1.0),
+        1.0
+    ) * 100
+
+    # Education Match (15%)
+    edu_scores = np.minimum(candidate['education_level'] / job_edu_arr, 1.0) * 100
+
+    # Keyword Similarity (10%)
+    sim_scores = sim_arr * 100
+
+    final = (skill_scores * 0.50) + (exp_scores * 0.25) + (edu_scores * 0.15) + (sim_scores * 0.10)
+
+    return [min(100, int(s)) for s in final]
+
+
 # =====================================================
 # JOB RECOMMENDATIONS (ADZUNA)
 # =====================================================
@@ -106,19 +262,40 @@ def get_job_recommendations():
         print(f"ERROR: Database error fetching resume: {str(e)}")
         resume = None
     
+    # Full analysis now lives in its own collection (resume docs carry
+    # only summary fields); fall back to the legacy inline subtree for
+    # resumes analyzed before the split
+    analysis_results = {}
+    if resume:
+        if isinstance(resume.get('analysis_results'), dict):
+            analysis_results = resume['analysis_results']
+        else:
+            results_doc = mongo.db.analysis_results.find_one(
+                {'resume_id': str(resume['_id']), 'user_id': user_id}
+            )
+            if results_doc and isinstance(results_doc.get('results'), dict):
+                analysis_results = results_doc['results']
+
     user_skills = []
 
-    if resume and isinstance(resume.get('analysis_results'), dict):
-        skills_data = resume.get('analysis_results', {}).get('skills', {})
-        if isinstance(skills_data, dict):
-            for category in skills_data.values():
-                if isinstance(category, dict) and 'skills' in category:
-                    user_skills.extend(category.get('skills', []))
+    skills_data = analysis_results.get('skills', {})
+    if isinstance(skills_data, dict):
+        for category in skills_data.values():
+            if isinstance(category, dict) and 'skills' in category:
+                user_skills.extend(category.get('skills', []))
 
-    # Fetch jobs from Adzuna
+    # Kick off the Adzuna fetch in a background thread as soon as skills are
+    # known, so the HTTP round-trip overlaps with the scoring preparation below.
     print(f"Fetching jobs for user {user_id} with skills: {user_skills[:5]}...")
-    adzuna_jobs = fetch_adzuna_jobs(user_skills, country="in")
-    
+    adzuna_future = _fetch_executor.submit(fetch_adzuna_jobs, user_skills, "in")
+
+    # Build the candidate-side scoring inputs once for all jobs while
+    # the HTTP call is in flight
+    candidate_profile = build_candidate_profile(analysis_results)
+
+    # Await the Adzuna response right before scoring
+    adzuna_jobs = adzuna_future.result()
+
     # Fallback to Mock Jobs if Adzuna is empty or keys are missing
     is_fallback = False
     if not adzuna_jobs:
@@ -152,8 +329,6 @@ def get_job_recommendations():
         ]
 
     matched_jobs = []
-    # Get analysis results for matching
-    analysis_results = resume.get('analysis_results', {}) if resume else {}
 
     for job in adzuna_jobs:
         # Standardize Adzuna company/location nested format if present
@@ -161,19 +336,28 @@ def get_job_recommendations():
             job['company_name'] = job['company'].get('display_name', 'N/A')
         else:
             job['company_name'] = job.get('company', 'N/A')
-            
+
         if isinstance(job.get('location'), dict):
             job['location_name'] = job['location'].get('display_name', 'N/A')
         else:
             job['location_name'] = job.get('location', 'N/A')
 
-        try:
-            # Use the new scoring function with analysis results
-            match_score = calculate_job_match_score(analysis_results, job)
-        except Exception as e:
-            print(f"ERROR: Scoring failed for job {job.get('title')}: {str(e)}")
-            match_score = 0
-
+    # Score all jobs in one vectorized pass; fall back to per-job scoring
+    # if the batch path fails for any reason
+    try:
+        match_scores = score_jobs_batch(analysis_results, adzuna_jobs)
+    except Exception as e:
+        print(f"ERROR: Batch scoring failed, falling back to per-job: {str(e)}")
+        match_scores = []
+        for job in adzuna_jobs:
+            try:
+                match_scores.append(calculate_job_match_score(
+                    analysis_results, job, candidate=candidate_profile))
+            except Exception as job_err:
+                print(f"ERROR: Scoring failed for job {job.get('title')}: {str(job_err)}")
+                match_scores.append(0)
+
+    for job, match_score in zip(adzuna_jobs, match_scores):
         # Only filter if we have real jobs, for mock jobs we show all to avoid empty list
         if is_fallback or match_score >= min_match:
             job['match_score'] = match_score
@@ -207,26 +391,17 @@ def get_job_recommendations():
             'apply_url': str(job.get('redirect_url', '#'))
         }
         
-        # Save recommendation to database for admin tracking
-        try:
-            mongo.db.job_recommendations.update_one(
-                {'user_id': user_id, 'job_id': job_data['id']},
-                {'$set': {
-                    'user_id': user_id,
-                    'user_name': resume.get('user_name', 'Unknown') if resume else 'Unknown',
-                    'job_id': job_data['id'],
-                    'title': title,
-                    'company': company,
-                    'match_score': job_data['match_score'],
-                    'recommended_at': datetime.utcnow()
-                }},
-                upsert=True
-            )
-        except Exception as e:
-            print(f"ERROR: Failed to save recommendation: {str(e)}")
-
         formatted_jobs.append(job_data)
 
+    # Save recommendations for admin tracking off the request path:
+    # the user only needs the job list, so the bulk upsert runs in the background
+    socketio.start_background_task(
+        _persist_recommendations,
+        user_id,
+        formatted_jobs,
+        resume.get('user_name', 'Unknown') if resume else 'Unknown'
+    )
+
     return jsonify({
         'success': True,
         'data': formatted_jobs,
@@ -282,13 +457,14 @@ def save_job(job_id):
 
     user_id = get_jwt_identity()
 
-    existing = mongo.db.saved_jobs.find_one({
+    # Atomic toggle: find_one_and_delete removes an existing entry in a single
+    # round-trip instead of the old find_one + delete_one pair
+    deleted = mongo.db.saved_jobs.find_one_and_delete({
         'user_id': user_id,
         'job_id': job_id
     })
 
-    if existing:
-        mongo.db.saved_jobs.delete_one({'_id': existing['_id']})
+    if deleted:
         return jsonify({
             'success': True,
             'message': 'Job removed from saved list',
@@ -13,16 +13,21 @@ Endpoints:
 All endpoints require authentication except where noted.
 """
 
+import contextlib
+import hashlib
 import os
+import time
 import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from werkzeug.utils import secure_filename
 from bson import ObjectId
+from pymongo import InsertOne, UpdateMany, UpdateOne, WriteConcern
 
 # Import our application components
 from app import mongo  # MongoDB instance
@@ -30,36 +35,218 @@ from app.services.nlp_analyzer import nlp_analyzer  # NLP service
 from app.services.ats_scorer import ats_scorer  # ATS scoring service
 from app.services.missing_skills import missing_skills_analyzer  # Skill gap analyzer
 from app.services.ats_converter import ats_converter  # ATS converter service
-from app.utils.pdf_parser import parse_resume_file  # File parser utility
+from app.utils.pdf_parser import parse_resume_file, parse_resume_bytes  # File parser utilities
 
 # Create Blueprint for resume routes
 # Blueprint groups related routes under a common URL prefix
 resume_bp = Blueprint('resume', __name__)
 
+# Default allowed extensions, built once at import time so each upload
+# doesn't rebuild the set literal
+_ALLOWED_EXTENSIONS = frozenset({'pdf', 'docx', 'doc', 'txt'})
+
+# Relaxed write concern for cache-style collections (analysis caches,
+# derived score snapshots, task bookkeeping): acknowledge on the primary
+# only and skip the journal fsync. Losing one of these writes just means
+# a recomputation, so there is no reason to pay journaling latency on
+# the synchronous request path.
+_CACHE_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
 
 def allowed_file(filename: str) -> bool:
     """
     Check if uploaded file has an allowed extension.
-    
+
     Args:
         filename: Name of the uploaded file
-    
+
     Returns:
         bool: True if extension is allowed, False otherwise
-    
+
     Example:
         allowed_file('resume.pdf')  # Returns True
         allowed_file('script.exe')  # Returns False
     """
-    # Get allowed extensions from config
-    allowed_extensions = current_app.config.get(
-        'ALLOWED_EXTENSIONS', 
-        {'pdf', 'docx', 'doc', 'txt'}
+    # os.path.splitext is implemented in C and returns '.ext' (or '')
+    ext = os.path.splitext(filename)[1][1:].lower()
+    return ext in current_app.config.get('ALLOWED_EXTENSIONS', _ALLOWED_EXTENSIONS)
+
+
+# ==============================================
+# Analysis Result Cache
+# ==============================================
+# The NLP analyzer and ATS scorer dominate CPU time in these routes, and
+# users frequently re-analyze the same (resume, job description) pair.
+# Results are cached in a dedicated Mongo collection keyed on a SHA-256
+# of the inputs, so a repeat call is a single indexed read instead of a
+# multi-second NLP pass. Cache failures never break the request.
+
+def _analysis_cache_get(key: str):
+    """Return cached results for key, or None on miss/error."""
+    try:
+        hit = mongo.db.analysis_cache.find_one({'_id': key})
+        return hit['results'] if hit else None
+    except Exception:
+        return None
+
+
+def _analysis_cache_put(key: str, results) -> None:
+    """Store results under key; ignores cache write failures."""
+    try:
+        mongo.db.analysis_cache.with_options(
+            write_concern=_CACHE_WRITE_CONCERN
+        ).update_one(
+            {'_id': key},
+            {'$set': {'results': results, 'cached_at': datetime.utcnow()}},
+            upsert=True
+        )
+    except Exception:
+        pass
+
+
+def _cached_nlp_analysis(resume_text: str, job_description: str = '') -> dict:
+    """Run nlp_analyzer.analyze_resume with a content-hash cache in front."""
+    key = 'nlp:' + hashlib.sha256(
+        f"{resume_text}\x1f{job_description}".encode('utf-8', 'ignore')
+    ).hexdigest()
+
+    results = _analysis_cache_get(key)
+    if results is None:
+        results = nlp_analyzer.analyze_resume(resume_text, job_description)
+        _analysis_cache_put(key, results)
+    return results
+
+
+def _cached_ats_score(resume_text: str, job_description: str = '', job_keywords=None) -> dict:
+    """Run ats_scorer.calculate_ats_score with a content-hash cache in front."""
+    keywords_part = '\x1f'.join(sorted(job_keywords)) if job_keywords else ''
+    key = 'ats:' + hashlib.sha256(
+        f"{resume_text}\x1f{job_description}\x1f{keywords_part}".encode('utf-8', 'ignore')
+    ).hexdigest()
+
+    results = _analysis_cache_get(key)
+    if results is None:
+        results = ats_scorer.calculate_ats_score(
+            resume_text, job_description, job_keywords=job_keywords
+        )
+        _analysis_cache_put(key, results)
+    return results
+
+
+# Chunk size for streaming uploads straight to disk
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shared executor for running the independent NLP and ATS pipelines
+# side by side instead of serially
+_analysis_executor = ThreadPoolExecutor(max_workers=4)
+
+
+def _run_with_app_context(app, fn, *args, **kwargs):
+    """Run fn inside an app context so worker threads can reach mongo."""
+    with app.app_context():
+        return fn(*args, **kwargs)
+
+
+def _user_identity_from_jwt(user_id):
+    """
+    Resolve (user_name, user_email) from the JWT claims.
+
+    Login stamps name/email into the token, so stamping metadata on
+    documents is a dict lookup instead of a users round-trip. Falls back
+    to a users query for tokens issued before the claims were added.
+    """
+    claims = get_jwt()
+    user_name = claims.get('name')
+    user_email = claims.get('email')
+    if not user_name or not user_email:
+        user_data = mongo.db.users.find_one({'_id': ObjectId(user_id)})
+        if user_data:
+            user_name = user_name or user_data.get('name', 'Unknown')
+            user_email = user_email or user_data.get('email', 'Unknown')
+    return user_name or 'Unknown', user_email or 'Unknown'
+
+
+def _reactivate_duplicate(user_id: str, content_hash: str, filename: str):
+    """
+    Return the stored upload response for a byte-identical prior upload.
+
+    Re-activates the existing document as the latest resume and returns
+    the response payload, or None when no duplicate exists.
+    """
+    existing = mongo.db.resumes.find_one(
+        {'user_id': user_id, 'content_hash': content_hash},
+        sort=[('upload_date', -1)]
     )
-    
-    # Check if filename has extension and it's in allowed list
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in allowed_extensions
+    if not existing or not existing.get('content'):
+        return None
+
+    # Re-activate the prior copy so it counts as the latest resume
+    # (archive + re-activate batched into one round-trip)
+    mongo.db.resumes.bulk_write([
+        UpdateMany(
+            {'user_id': user_id, 'is_active': True},
+            {'$set': {'is_active': False}}
+        ),
+        UpdateOne(
+            {'_id': existing['_id']},
+            {'$set': {'is_active': True, 'upload_date': datetime.utcnow()}}
+        )
+    ], ordered=True)
+
+    resume_text = existing['content']
+    preview = resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
+
+    return {
+        'success': True,
+        'message': 'Resume uploaded successfully',
+        'data': {
+            'resume_id': str(existing['_id']),
+            'filename': existing.get('filename', filename),
+            'preview': preview,
+            'word_count': len(resume_text.split()),
+            'duplicate': True
+        }
+    }
+
+
+def _store_resume_document(user_id, filename, file_path, resume_text,
+                           file_size, content_hash) -> str:
+    """
+    Score, archive old resumes, and insert the new resume document.
+
+    Returns the new resume id as a string.
+    """
+    # Calculate Initial ATS Score automatically
+    ats_results = _cached_ats_score(resume_text)
+
+    # Create resume document
+    resume_doc = {
+        '_id': ObjectId(),                      # Generated client-side for bulk insert
+        'user_id': user_id,                    # Owner of the resume
+        'filename': filename,                   # Original filename
+        'file_path': file_path,                 # Storage path
+        'content': resume_text,                 # Extracted text
+        'content_hash': content_hash,           # For duplicate detection
+        'file_size': file_size,
+        'upload_date': datetime.utcnow(),       # Upload timestamp
+        'analyzed': False,                       # Analysis status
+        'analysis_results': None,                # Will store analysis
+        'ats_score': ats_results['overall_score'],
+        'ats_breakdown': ats_results['breakdown'],
+        'is_active': True                        # Newest is active
+    }
+
+    # Archive previous resumes and insert the new one in a single
+    # bulk_write round-trip (ordered so the archive runs first)
+    mongo.db.resumes.bulk_write([
+        UpdateMany(
+            {'user_id': user_id, 'is_active': True},
+            {'$set': {'is_active': False}}
+        ),
+        InsertOne(resume_doc)
+    ], ordered=True)
+
+    return str(resume_doc['_id'])
 
 
 @resume_bp.route('/upload', methods=['POST'])
@@ -120,29 +307,49 @@ def upload_resume():
     # Secure the filename to prevent path traversal attacks
     filename = secure_filename(file.filename)
     
-    # Create unique filename with timestamp
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-    unique_filename = f"{user_id}_{timestamp}_{filename}"
+    # Create unique filename; time_ns avoids the datetime+strftime
+    # round-trip and the 1-second collision window under burst uploads
+    unique_filename = f"{user_id}_{time.time_ns()}_{filename}"
     
     # Ensure upload directory exists
     upload_folder = current_app.config['UPLOAD_FOLDER']
     os.makedirs(upload_folder, exist_ok=True)
-    
-    # Save file to disk
+
+    # Read the upload once; the same bytes serve the parser, the size
+    # field, and the copy persisted to disk (no re-reads from disk)
+    data = file.read()
+    file_size = len(data)
+
+    # ==========================================
+    # Deduplicate Identical Uploads
+    # ==========================================
+
+    # If this user already uploaded a byte-identical file, skip the
+    # parse/score/insert entirely and hand back the stored copy
+    content_hash = hashlib.sha256(data).hexdigest()
+    duplicate = _reactivate_duplicate(user_id, content_hash, filename)
+    if duplicate:
+        return jsonify(duplicate), 200
+
     file_path = os.path.join(upload_folder, unique_filename)
-    file.save(file_path)
-    
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
     # ==========================================
     # Parse Resume Content
     # ==========================================
-    
+
     try:
-        # Extract text content from the file
-        resume_text = parse_resume_file(file_path)
-        
+        # Extract text content straight from the in-memory bytes
+        # (legacy .doc needs antiword on a real file, so fall back to disk)
+        try:
+            resume_text = parse_resume_bytes(data, filename)
+        except ValueError:
+            resume_text = parse_resume_file(file_path)
+
         # Get preview (first 500 characters)
         preview = resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
-        
+
     except Exception as e:
         # Clean up file if parsing fails
         os.remove(file_path)
@@ -154,42 +361,106 @@ def upload_resume():
     # ==========================================
     # Store in MongoDB
     # ==========================================
-    
-    # Optional: Mark previous resumes as inactive (archived)
-    try:
-        mongo.db.resumes.update_many(
-            {'user_id': user_id, 'is_active': True},
-            {'$set': {'is_active': False}}
-        )
-    except Exception as e:
-        print(f"WARNING: Failed to archive old resumes: {str(e)}")
 
-    # Calculate Initial ATS Score automatically
-    ats_results = ats_scorer.calculate_ats_score(resume_text)
-    
-    # Create resume document
-    resume_doc = {
-        'user_id': user_id,                    # Owner of the resume
-        'filename': filename,                   # Original filename
-        'file_path': file_path,                 # Storage path
-        'content': resume_text,                 # Extracted text
-        'file_size': os.path.getsize(file_path),
-        'upload_date': datetime.utcnow(),       # Upload timestamp
-        'analyzed': False,                       # Analysis status
-        'analysis_results': None,                # Will store analysis
-        'ats_score': ats_results['overall_score'],
-        'ats_breakdown': ats_results['breakdown'],
-        'is_active': True                        # Newest is active
-    }
-    
-    # Insert into MongoDB and get the generated ID
-    result = mongo.db.resumes.insert_one(resume_doc)
-    resume_id = str(result.inserted_id)
-    
+    resume_id = _store_resume_document(
+        user_id, filename, file_path, resume_text, file_size, content_hash
+    )
+
     # ==========================================
     # Return Response
     # ==========================================
-    
+
+    return jsonify({
+        'success': True,
+        'message': 'Resume uploaded successfully',
+        'data': {
+            'resume_id': resume_id,
+            'filename': filename,
+            'preview': preview,
+            'word_count': len(resume_text.split())
+        }
+    }), 200
+@resume_bp.route('/upload-stream', methods=['POST'])
+@jwt_required()
+def upload_resume_stream():
+    """
+    Streaming variant of resume upload for raw request bodies.
+
+    Reads the request body in fixed 64KB chunks straight to disk, so
+    memory use stays constant regardless of file size (the multipart
+    /upload route buffers the whole file). The content hash and byte
+    count are accumulated during the copy, avoiding any re-read.
+
+    Request:
+        - Method: POST
+        - Content-Type: application/octet-stream
+        - Query: filename (original filename, used for type detection)
+        - Body: raw file bytes
+
+    Response:
+        - 200: Success with file ID and extracted text preview
+        - 400: Bad request (missing filename, invalid type, empty body)
+    """
+    user_id = get_jwt_identity()
+
+    filename = secure_filename(request.args.get('filename', ''))
+    if not filename:
+        return jsonify({
+            'error': 'No filename provided',
+            'message': 'Pass the original filename as a query parameter'
+        }), 400
+
+    if not allowed_file(filename):
+        return jsonify({
+            'error': 'Invalid file type',
+            'message': 'Allowed types: PDF and DOCX only (Limit: 5MB)'
+        }), 400
+
+    unique_filename = f"{user_id}_{time.time_ns()}_{filename}"
+
+    upload_folder = current_app.config['UPLOAD_FOLDER']
+    os.makedirs(upload_folder, exist_ok=True)
+    file_path = os.path.join(upload_folder, unique_filename)
+
+    # Stream to disk in fixed-size chunks, hashing and counting as we go
+    hasher = hashlib.sha256()
+    file_size = 0
+    with open(file_path, 'wb') as f:
+        while True:
+            chunk = request.stream.read(_UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            file_size += len(chunk)
+            f.write(chunk)
+
+    if file_size == 0:
+        os.remove(file_path)
+        return jsonify({
+            'error': 'Empty upload',
+            'message': 'Request body contained no data'
+        }), 400
+
+    content_hash = hasher.hexdigest()
+    duplicate = _reactivate_duplicate(user_id, content_hash, filename)
+    if duplicate:
+        os.remove(file_path)
+        return jsonify(duplicate), 200
+
+    try:
+        resume_text = parse_resume_file(file_path)
+        preview = resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
+    except Exception as e:
+        os.remove(file_path)
+        return jsonify({
+            'error': 'Failed to parse file',
+            'message': str(e)
+        }), 400
+
+    resume_id = _store_resume_document(
+        user_id, filename, file_path, resume_text, file_size, content_hash
+    )
+
     return jsonify({
         'success': True,
         'message': 'Resume uploaded successfully',
@@ -200,6 +471,8 @@ def upload_resume():
             'word_count': len(resume_text.split())
         }
     }), 200
+
+
 @resume_bp.route('/latest', methods=['GET'])
 @jwt_required()
 def get_latest_resume():
@@ -207,18 +480,32 @@ def get_latest_resume():
     Get the user's most recently uploaded active resume.
     """
     user_id = get_jwt_identity()
-    
+
+    # Inclusion projection: the "latest resume" card only needs summary
+    # fields, so don't ship (or BSON-decode) content, legacy
+    # analysis_results subtrees or ATS breakdowns
+    projection = {
+        'filename': 1,
+        'upload_date': 1,
+        'analyzed': 1,
+        'ats_score': 1,
+        'match_score': 1,
+        'total_skills_found': 1,
+        'file_size': 1,
+        'status': 1
+    }
+
     try:
         resume = mongo.db.resumes.find_one(
             {'user_id': user_id, 'is_active': True},
-            {'content': 0}  # Exclude content
+            projection
         )
-        
+
         if not resume:
             # Fallback to the latest uploaded by date
             resume = mongo.db.resumes.find_one(
                 {'user_id': user_id},
-                {'content': 0},
+                projection,
                 sort=[('upload_date', -1)]
             )
             
@@ -279,14 +566,16 @@ def analyze_resume():
     if not resume_id:
         return jsonify({'error': 'resume_id is required'}), 400
     
-    # Find resume in MongoDB
-    try:
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id  # Ensure user owns this resume
-        })
-    except Exception:
+    # is_valid is a cheap C-level check; constructing ObjectId on a
+    # malformed id would raise and format an exception instead
+    if not ObjectId.is_valid(resume_id):
         return jsonify({'error': 'Invalid resume ID'}), 400
+
+    # Find resume in MongoDB
+    resume = mongo.db.resumes.find_one({
+        '_id': ObjectId(resume_id),
+        'user_id': user_id  # Ensure user owns this resume
+    })
     
     if not resume:
         return jsonify({'error': 'Resume not found'}), 404
@@ -305,35 +594,12 @@ def analyze_resume():
                 'message': 'This resume has no text content to analyze.'
             }), 400
 
-        # Use NLP analyzer to extract information
-        analysis_results = nlp_analyzer.analyze_resume(
-            resume_text, 
-            job_description
-        )
-        
-        # Extract flattened resume skills for missing skills analyzer
-        resume_skills_flat = []
-        for cat_data in analysis_results.get('skills', {}).values():
-            resume_skills_flat.extend(cat_data.get('skills', []))
-        
-        # Perform detailed missing skills analysis
-        missing_analysis = missing_skills_analyzer.analyze(
-            resume_skills_flat,
-            job_description
+        user_name, user_email = _user_identity_from_jwt(user_id)
+        analysis_results = _perform_full_analysis(
+            resume, resume_id, user_id, job_description,
+            user_name=user_name, user_email=user_email
         )
-        
-        # Calculate dynamic ATS score
-        ats_results = ats_scorer.calculate_ats_score(
-            resume_text,
-            job_description
-        )
-        
-        # Merge results
-        analysis_results['missing_skills_detailed'] = missing_analysis
-        analysis_results['ats_score'] = ats_results['overall_score']
-        analysis_results['ats_breakdown'] = ats_results['breakdown']
-        analysis_results['ats_recommendations'] = ats_results['recommendations']
-        
+
     except Exception as e:
         import traceback
         current_app.logger.error(f"Analysis failed: {str(e)}")
@@ -345,15 +611,91 @@ def analyze_resume():
         }), 500
     
     # ==========================================
-    # Update MongoDB Document
+    # Return Results
     # ==========================================
-    
-    # Get user details for metadata
-    user_data = mongo.db.users.find_one({'_id': ObjectId(user_id)})
-    user_name = user_data.get('name', 'Unknown') if user_data else 'Unknown'
-    user_email = user_data.get('email', 'Unknown') if user_data else 'Unknown'
 
-    # Store analysis results in the resume document
+    return jsonify({
+        'success': True,
+        'data': {
+            'resume_id': resume_id,
+            'skills': analysis_results['skills'],
+            'experience': analysis_results['experience'],
+            'education': analysis_results['education'],
+            'match_score': analysis_results['match_score'],
+            'missing_skills': analysis_results['missing_skills'],  # Keep for backward compatibility
+            'missing_skills_detailed': analysis_results.get('missing_skills_detailed'),
+            'total_skills': analysis_results['total_skills_found']
+        }
+    }), 200
+
+
+def _perform_full_analysis(resume, resume_id, user_id, job_description,
+                           user_name='Unknown', user_email='Unknown',
+                           in_worker=False) -> dict:
+    """
+    Run the full analysis pipeline for a resume and persist the results.
+
+    Shared by the synchronous /analyze route and the background
+    /analyze-async task. Raises on analysis failure.
+
+    in_worker must be True when the caller is itself running on
+    _analysis_executor: submitting the ATS pass back to the same pool
+    and blocking on it would deadlock once every worker holds an outer
+    task, so in that case the ATS pass runs inline instead.
+    """
+    resume_text = resume.get('content')
+
+    # Kick off ATS scoring in a worker thread; it shares no data
+    # with the NLP pass below, so the two pipelines run side by side
+    ats_future = None
+    if not in_worker:
+        ats_future = _analysis_executor.submit(
+            _run_with_app_context, current_app._get_current_object(),
+            _cached_ats_score, resume_text, job_description
+        )
+
+    # Use NLP analyzer to extract information (cached by content hash)
+    analysis_results = _cached_nlp_analysis(resume_text, job_description)
+
+    # Extract flattened resume skills for missing skills analyzer
+    resume_skills_flat = []
+    for cat_data in analysis_results.get('skills', {}).values():
+        resume_skills_flat.extend(cat_data.get('skills', []))
+
+    # Perform detailed missing skills analysis
+    missing_analysis = missing_skills_analyzer.analyze(
+        resume_skills_flat,
+        job_description
+    )
+
+    # Collect the dynamic ATS score computed in parallel (or compute it
+    # inline when running on an executor worker)
+    if ats_future is not None:
+        ats_results = ats_future.result()
+    else:
+        ats_results = _cached_ats_score(resume_text, job_description)
+
+    # Merge results
+    analysis_results['missing_skills_detailed'] = missing_analysis
+    analysis_results['ats_score'] = ats_results['overall_score']
+    analysis_results['ats_breakdown'] = ats_results['breakdown']
+    analysis_results['ats_recommendations'] = ats_results['recommendations']
+
+    # Store the full (large) analysis subtree in its own collection so
+    # the resume doc stays small: every find_one on resumes BSON-decodes
+    # the whole document, and the history/latest routes don't need the
+    # full breakdown
+    mongo.db.analysis_results.update_one(
+        {'resume_id': str(resume_id), 'user_id': user_id},
+        {'$set': {
+            'results': analysis_results,
+            'analysis_date': datetime.utcnow()
+        }},
+        upsert=True
+    )
+
+    # Keep only summary fields inline on the resume document; $unset
+    # slims down docs analyzed before the split
     mongo.db.resumes.update_one(
         {'_id': ObjectId(resume_id)},
         {
@@ -362,32 +704,167 @@ def analyze_resume():
                 'user_name': user_name,
                 'user_email': user_email,
                 'analyzed': True,
-                'analysis_results': analysis_results,
+                'ats_score': analysis_results['ats_score'],
+                'match_score': analysis_results.get('match_score', 0),
+                'total_skills_found': analysis_results.get('total_skills_found', 0),
                 'analysis_date': datetime.utcnow(),
                 'job_description': job_description,
                 'status': 'Analyzed',
                 'created_at': resume.get('created_at', datetime.utcnow())
-            }
+            },
+            '$unset': {'analysis_results': ''}
         }
     )
-    
-    # ==========================================
-    # Return Results
-    # ==========================================
-    
+
+    return analysis_results
+
+
+def _load_analysis_results(resume_id, user_id, resume=None):
+    """
+    Fetch the full analysis results for a resume.
+
+    Reads the dedicated analysis_results collection first, falling back
+    to the legacy inline subtree for resumes analyzed before the split.
+    Returns None when the resume has never been analyzed.
+    """
+    results_doc = mongo.db.analysis_results.find_one(
+        {'resume_id': str(resume_id), 'user_id': user_id}
+    )
+    if results_doc and isinstance(results_doc.get('results'), dict):
+        return results_doc['results']
+    if resume and isinstance(resume.get('analysis_results'), dict):
+        return resume['analysis_results']
+    return None
+
+
+def _run_analysis_task(task_id, resume, resume_id, user_id, job_description,
+                       user_name='Unknown', user_email='Unknown'):
+    """Background body for /analyze-async; records progress in analysis_tasks."""
+    try:
+        analysis_results = _perform_full_analysis(
+            resume, resume_id, user_id, job_description,
+            user_name=user_name, user_email=user_email,
+            in_worker=True
+        )
+        mongo.db.analysis_tasks.with_options(
+            write_concern=_CACHE_WRITE_CONCERN
+        ).update_one(
+            {'_id': task_id},
+            {'$set': {
+                'status': 'completed',
+                'completed_at': datetime.utcnow(),
+                'result_summary': {
+                    'match_score': analysis_results['match_score'],
+                    'ats_score': analysis_results['ats_score'],
+                    'total_skills': analysis_results['total_skills_found']
+                }
+            }}
+        )
+    except Exception as e:
+        mongo.db.analysis_tasks.with_options(
+            write_concern=_CACHE_WRITE_CONCERN
+        ).update_one(
+            {'_id': task_id},
+            {'$set': {
+                'status': 'failed',
+                'completed_at': datetime.utcnow(),
+                'error': str(e)
+            }}
+        )
+
+
+@resume_bp.route('/analyze-async', methods=['POST'])
+@jwt_required()
+def analyze_resume_async():
+    """
+    Queue a resume analysis in the background.
+
+    Unlike /analyze, the HTTP worker is released immediately: the heavy
+    NLP/ATS pipeline runs on the shared executor, and the client polls
+    /api/resume/status/<task_id> for completion. The results land on the
+    resume document exactly as with the synchronous route.
+
+    Response:
+        - 202: Accepted, with task_id for polling
+        - 400/404: Validation errors, as for /analyze
+    """
+    user_id = get_jwt_identity()
+    data = request.get_json()
+
+    resume_id = data.get('resume_id')
+    job_description = data.get('job_description', '')
+
+    if not resume_id:
+        return jsonify({'error': 'resume_id is required'}), 400
+
+    # is_valid is a cheap C-level check; constructing ObjectId on a
+    # malformed id would raise and format an exception instead
+    if not ObjectId.is_valid(resume_id):
+        return jsonify({'error': 'Invalid resume ID'}), 400
+
+    resume = mongo.db.resumes.find_one({
+        '_id': ObjectId(resume_id),
+        'user_id': user_id
+    })
+
+    if not resume:
+        return jsonify({'error': 'Resume not found'}), 404
+
+    if not resume.get('content'):
+        return jsonify({
+            'success': False,
+            'error': 'Missing content',
+            'message': 'This resume has no text content to analyze.'
+        }), 400
+
+    task_id = str(uuid.uuid4())
+    mongo.db.analysis_tasks.insert_one({
+        '_id': task_id,
+        'user_id': user_id,
+        'resume_id': str(resume_id),
+        'status': 'pending',
+        'created_at': datetime.utcnow()
+    })
+
+    # Resolve the identity claims now — the worker thread has no
+    # request context to read the JWT from
+    user_name, user_email = _user_identity_from_jwt(user_id)
+
+    _analysis_executor.submit(
+        _run_with_app_context, current_app._get_current_object(),
+        _run_analysis_task, task_id, resume, resume_id, user_id, job_description,
+        user_name=user_name, user_email=user_email
+    )
+
     return jsonify({
         'success': True,
-        'data': {
-            'resume_id': resume_id,
-            'skills': analysis_results['skills'],
-            'experience': analysis_results['experience'],
-            'education': analysis_results['education'],
-            'match_score': analysis_results['match_score'],
-            'missing_skills': analysis_results['missing_skills'],  # Keep for backward compatibility
-            'missing_skills_detailed': analysis_results.get('missing_skills_detailed'),
-            'total_skills': analysis_results['total_skills_found']
-        }
-    }), 200
+        'task_id': task_id,
+        'status': 'pending'
+    }), 202
+
+
+@resume_bp.route('/status/<task_id>', methods=['GET'])
+@jwt_required()
+def get_analysis_task_status(task_id):
+    """Poll the status of a background analysis task."""
+    user_id = get_jwt_identity()
+
+    task = mongo.db.analysis_tasks.find_one({'_id': task_id, 'user_id': user_id})
+    if not task:
+        return jsonify({'error': 'Task not found'}), 404
+
+    response = {
+        'success': True,
+        'task_id': task_id,
+        'resume_id': task.get('resume_id'),
+        'status': task.get('status')
+    }
+    if task.get('status') == 'completed':
+        response['result_summary'] = task.get('result_summary')
+    elif task.get('status') == 'failed':
+        response['error'] = task.get('error')
+
+    return jsonify(response), 200
 
 
 @resume_bp.route('/skill-analysis', methods=['POST'])
@@ -405,21 +882,32 @@ def skill_analysis():
     if not resume_id:
         return jsonify({'error': 'resume_id is required'}), 400
     
-    try:
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
-    except Exception:
+    # is_valid is a cheap C-level check; constructing ObjectId on a
+    # malformed id would raise and format an exception instead
+    if not ObjectId.is_valid(resume_id):
         return jsonify({'error': 'Invalid resume ID'}), 400
+
+    resume = mongo.db.resumes.find_one({
+        '_id': ObjectId(resume_id),
+        'user_id': user_id
+    })
     
     if not resume:
         return jsonify({'error': 'Resume not found'}), 404
     
     try:
-        # Perform NLP Analysis
         resume_text = resume.get('content')
-        analysis_results = nlp_analyzer.analyze_resume(resume_text, job_description)
+
+        # Reuse the analysis /analyze already stored for this resume when
+        # it covered the same job description; otherwise recompute
+        # (content-hash cached) — avoids a second full NLP pass in the
+        # common analyze-then-skill-analysis flow
+        analysis_results = None
+        if (resume.get('analyzed')
+                and resume.get('job_description', '') == job_description):
+            analysis_results = _load_analysis_results(resume_id, user_id, resume)
+        if analysis_results is None:
+            analysis_results = _cached_nlp_analysis(resume_text, job_description)
         
         # Skill analysis
         resume_skills_flat = []
@@ -442,7 +930,9 @@ def skill_analysis():
         }
         
         # Store separately
-        mongo.db.skill_analysis.update_one(
+        mongo.db.skill_analysis.with_options(
+            write_concern=_CACHE_WRITE_CONCERN
+        ).update_one(
             {'resume_id': str(resume_id), 'user_id': user_id},
             {'$set': skill_data},
             upsert=True
@@ -493,13 +983,15 @@ def calculate_ats_score():
     resume_id = data.get('resume_id')
     job_description = data.get('job_description', '')
     
-    try:
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
-    except Exception:
+    # is_valid is a cheap C-level check; constructing ObjectId on a
+    # malformed id would raise and format an exception instead
+    if not ObjectId.is_valid(resume_id):
         return jsonify({'error': 'Invalid resume ID'}), 400
+
+    resume = mongo.db.resumes.find_one({
+        '_id': ObjectId(resume_id),
+        'user_id': user_id
+    })
     
     if not resume:
         return jsonify({'error': 'Resume not found'}), 404
@@ -509,8 +1001,8 @@ def calculate_ats_score():
     # ==========================================
     
     try:
-        # Use ATS scorer service
-        ats_results = ats_scorer.calculate_ats_score(
+        # Use ATS scorer service (cached by content hash)
+        ats_results = _cached_ats_score(
             resume['content'],
             job_description,
             job_keywords=data.get('job_keywords')
@@ -529,10 +1021,8 @@ def calculate_ats_score():
     # Store Results
     # ==========================================
     
-    # Get user details for metadata
-    user_data = mongo.db.users.find_one({'_id': ObjectId(user_id)})
-    user_name = user_data.get('name', 'Unknown') if user_data else 'Unknown'
-    user_email = user_data.get('email', 'Unknown') if user_data else 'Unknown'
+    # Get user details from the JWT claims (no users round-trip)
+    user_name, user_email = _user_identity_from_jwt(user_id)
 
     # Update resume with ATS results (legacy support)
     mongo.db.resumes.update_one(
@@ -557,7 +1047,9 @@ def calculate_ats_score():
         'scored_at': datetime.utcnow()
     }
     
-    mongo.db.ats_results.update_one(
+    mongo.db.ats_results.with_options(
+        write_concern=_CACHE_WRITE_CONCERN
+    ).update_one(
         {'resume_id': str(resume_id), 'user_id': user_id},
         {'$set': ats_data},
         upsert=True
@@ -581,14 +1073,12 @@ def save_resume_metadata():
     if not resume_id:
         return jsonify({'error': 'resume_id is required'}), 400
         
-    user_data = mongo.db.users.find_one({'_id': ObjectId(user_id)})
-    if not user_data:
-        return jsonify({'error': 'User not found'}), 404
-        
+    user_name, user_email = _user_identity_from_jwt(user_id)
+
     update_fields = {
         'user_id': user_id,
-        'user_name': user_data.get('name'),
-        'user_email': user_data.get('email'),
+        'user_name': user_name,
+        'user_email': user_email,
         'updated_at': datetime.utcnow()
     }
     
@@ -623,13 +1113,15 @@ def get_skills(resume_id: str):
     """
     user_id = get_jwt_identity()
     
-    try:
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
-    except Exception:
+    # is_valid is a cheap C-level check; constructing ObjectId on a
+    # malformed id would raise and format an exception instead
+    if not ObjectId.is_valid(resume_id):
         return jsonify({'error': 'Invalid resume ID'}), 400
+
+    resume = mongo.db.resumes.find_one({
+        '_id': ObjectId(resume_id),
+        'user_id': user_id
+    })
     
     if not resume:
         return jsonify({'error': 'Resume not found'}), 404
@@ -637,7 +1129,8 @@ def get_skills(resume_id: str):
     if not resume.get('analyzed'):
         return jsonify({'error': 'Resume not yet analyzed'}), 400
     
-    skills = resume.get('analysis_results', {}).get('skills', {})
+    analysis_results = _load_analysis_results(resume_id, user_id, resume) or {}
+    skills = analysis_results.get('skills', {})
     
     return jsonify({
         'success': True,
@@ -669,25 +1162,38 @@ def get_analysis_history():
     limit = request.args.get('limit', 10, type=int)
     skip = request.args.get('skip', 0, type=int)
     
-    # Query MongoDB for user's resumes
-    resumes = mongo.db.resumes.find(
-        {'user_id': user_id},
-        {
-            'content': 0,  # Exclude full content for performance
-            'file_path': 0
-        }
-    ).sort('upload_date', -1).skip(skip).limit(limit)
-    
+    # Aggregate so the server returns only the six fields the response
+    # needs (instead of BSON-decoding whole analysis_results subtrees)
+    # and computes skills_count before the documents hit the driver
+    pipeline = [
+        {'$match': {'user_id': user_id}},
+        {'$sort': {'upload_date': -1}},
+        {'$skip': skip},
+        {'$limit': limit},
+        {'$project': {
+            'filename': 1,
+            'upload_date': 1,
+            'analyzed': {'$ifNull': ['$analyzed', False]},
+            'ats_score': 1,
+            # Prefer the inline summary field; older docs only carry the
+            # count inside the (since split-out) analysis_results subtree
+            'skills_count': {'$ifNull': [
+                '$total_skills_found',
+                {'$ifNull': ['$analysis_results.total_skills_found', 0]}
+            ]}
+        }}
+    ]
+
     # Format response
     history = []
-    for resume in resumes:
+    for resume in mongo.db.resumes.aggregate(pipeline):
         history.append({
             'resume_id': str(resume['_id']),
             'filename': resume['filename'],
             'upload_date': resume['upload_date'].isoformat(),
-            'analyzed': resume.get('analyzed', False),
+            'analyzed': resume['analyzed'],
             'ats_score': resume.get('ats_score'),
-            'skills_count': resume.get('analysis_results', {}).get('total_skills_found', 0)
+            'skills_count': resume['skills_count']
         })
     
     return jsonify({
@@ -728,13 +1234,15 @@ def analyze_text():
             'message': 'Resume text must be at least 100 characters'
         }), 400
     
-    # Perform analysis
-    analysis = nlp_analyzer.analyze_resume(resume_text, job_description)
-    ats_results = ats_scorer.calculate_ats_score(
-        resume_text, 
-        job_description,
+    # Perform analysis (both passes cached by content hash); the NLP and
+    # ATS pipelines are independent, so run them concurrently
+    ats_future = _analysis_executor.submit(
+        _run_with_app_context, current_app._get_current_object(),
+        _cached_ats_score, resume_text, job_description,
         job_keywords=data.get('job_keywords')
     )
+    analysis = _cached_nlp_analysis(resume_text, job_description)
+    ats_results = ats_future.result()
     
     return jsonify({
         'success': True,
@@ -806,8 +1314,6 @@ def convert_ats():
         current_app.logger.info(f"DEBUG: Extracted text length for {filename}: {len(resume_text) if resume_text else 0}")
         
         if not resume_text:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
             current_app.logger.error(f"DEBUG: Extraction failed for {filename}")
             return jsonify({
                 'error': 'Extraction Failed',
@@ -815,8 +1321,6 @@ def convert_ats():
             }), 400
             
         if resume_text == "__IMAGE_ONLY_PDF__":
-             if os.path.exists(temp_path):
-                os.remove(temp_path)
              return jsonify({
                 'error': 'Scanned Document Detected',
                 'message': 'This PDF contains only images and no selectable text. For accurate analysis, please provide a digital version exported from Word, Canva (without flattening), or Google Docs.'
@@ -830,10 +1334,8 @@ def convert_ats():
         # Use ATS Converter
         result = ats_converter.convert_resume(resume_text, job_keywords)
         
-        # Get user details for metadata
-        user_data = mongo.db.users.find_one({'_id': ObjectId(user_id)})
-        user_name = user_data.get('name', 'Unknown') if user_data else 'Unknown'
-        user_email = user_data.get('email', 'Unknown') if user_data else 'Unknown'
+        # Get user details from the JWT claims (no users round-trip)
+        user_name, user_email = _user_identity_from_jwt(user_id)
 
         # Ensure contact section has at least basic info if extraction failed
         if not result.get('sections'):
@@ -880,10 +1382,6 @@ def convert_ats():
             'upload_date': datetime.utcnow()
         })
 
-        # Clean up temp file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
         return jsonify({
             'success': True,
             'data': {
@@ -901,18 +1399,23 @@ def convert_ats():
         }), 200
         
     except Exception as e:
-        # Clean up on error
-        if temp_path and os.path.exists(temp_path):
-            os.remove(temp_path)
-        
         import traceback
         print(f"Conversion error: {str(e)}")
         print(traceback.format_exc())
-        
+
         return jsonify({
             'error': 'Conversion failed',
             'message': str(e)
         }), 500
+    finally:
+        # Single cleanup point for every exit path; suppress(OSError)
+        # skips the extra stat of an exists() check and tolerates the
+        # file never having been written
+        if temp_path:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+
+
 @resume_bp.route('/update-ats/<resume_id>', methods=['POST'])
 @jwt_required()
 def update_ats_resume(resume_id):
@@ -956,11 +1459,12 @@ def download_resume(resume_id):
     
     try:
         from app.services.ats_converter import ats_converter
-        # Fetch the stored optimized resume from MongoDB
-        resume_data = mongo.db.ats_resumes.find_one({
-            'resume_id': resume_id,
-            'user_id': user_id
-        })
+        # Fetch only the cached sections: the doc also carries the full
+        # ats_resume text, which the generators don't need
+        resume_data = mongo.db.ats_resumes.find_one(
+            {'resume_id': resume_id, 'user_id': user_id},
+            {'sections': 1}
+        )
         
         if not resume_data:
             return jsonify({
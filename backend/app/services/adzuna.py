@@ -1,4 +1,49 @@
 import os, requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes the nested Adzuna listing payloads a few times faster
+# than stdlib json (same optional dependency the app factory uses)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Short-lived result cache: the same skills/location query is often
+# repeated within minutes (page refreshes, re-analysis), and each hit
+# saves an external round-trip plus Adzuna quota. cachetools caches are
+# not thread-safe and this one is hit from request threads and several
+# thread pools at once, so access is serialized by the lock.
+_results_cache = TTLCache(maxsize=1024, ttl=600)
+_results_lock = threading.Lock()
+
+# Shared session: keep-alive + TLS reuse avoids a fresh handshake per
+# Adzuna call, and transient 5xx/429 responses are retried with backoff
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
+@lru_cache(maxsize=512)
+def _what_query(skills_tuple):
+    """Joined 'what' parameter, memoized per skills tuple.
+
+    Paginated and retried calls reuse the same skills, so pages 2..N hit
+    the cache instead of re-slicing and re-joining."""
+    return " ".join(skills_tuple[:8])   # keep query concise
+
 
 def fetch_adzuna_jobs(
     skills,
@@ -16,12 +61,20 @@ def fetch_adzuna_jobs(
         print("WARNING: ADZUNA_APP_ID or ADZUNA_APP_KEY not set in environment.")
         return []
 
+    # Canonicalized key so skill order doesn't fragment the cache
+    cache_key = (tuple(sorted(skills[:8])), country, location, page,
+                 per_page, salary_min, remote)
+    with _results_lock:
+        cached = _results_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     endpoint = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
 
     params = {
         "app_id": app_id,
         "app_key": app_key,
-        "what": " ".join(skills[:8]),   # keep query concise
+        "what": _what_query(tuple(skills)),
         "where": location,
         "results_per_page": per_page,
         "content-type": "application/json",
@@ -33,10 +86,118 @@ def fetch_adzuna_jobs(
         params["full_time"] = 1
 
     try:
-        r = requests.get(endpoint, params=params, timeout=15)
+        r = _session.get(endpoint, params=params, timeout=15)
         r.raise_for_status()
-        return r.json().get("results", [])
+        # r.content is a single bytes buffer; decode it directly rather
+        # than going through r.json()'s charset sniffing + stdlib json
+        results = _loads(r.content).get("results", [])
+        # Only cache non-empty payloads so transient failures don't
+        # pin the mock-job fallback for the full TTL
+        if results:
+            with _results_lock:
+                _results_cache[cache_key] = results
+        return results
     except Exception as e:
         print(f"ERROR: Adzuna API request failed: {str(e)}")
         # Return empty list to trigger fallback in the route
         return []
+
+
+def fetch_adzuna_jobs_multi(
+    skills,
+    pages,
+    country="in",
+    location="",
+    per_page=20,
+    salary_min=None,
+    remote=None
+):
+    """
+    Fetch several Adzuna result pages concurrently.
+
+    The page requests are independent, so they are issued together over
+    one aiohttp session: N pages complete in roughly the latency of the
+    slowest page instead of the sum. Falls back to serial
+    fetch_adzuna_jobs calls if aiohttp is unavailable.
+    """
+    pages = list(pages)
+    if not pages:
+        return []
+
+    try:
+        import asyncio
+        import aiohttp
+    except ImportError:
+        results = []
+        for page in pages:
+            results.extend(fetch_adzuna_jobs(
+                skills, country=country, location=location, page=page,
+                per_page=per_page, salary_min=salary_min, remote=remote
+            ))
+        return results
+
+    app_id = os.getenv("ADZUNA_APP_ID")
+    app_key = os.getenv("ADZUNA_APP_KEY")
+
+    if not app_id or not app_key:
+        print("WARNING: ADZUNA_APP_ID or ADZUNA_APP_KEY not set in environment.")
+        return []
+
+    params = {
+        "app_id": app_id,
+        "app_key": app_key,
+        "what": _what_query(tuple(skills)),
+        "where": location,
+        "results_per_page": per_page,
+        "content-type": "application/json",
+    }
+    if salary_min:
+        params["salary_min"] = salary_min
+    if remote is True:
+        params["full_time"] = 1
+
+    async def _fetch_page(session, page):
+        endpoint = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
+        try:
+            async with session.get(endpoint, params=params, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                resp.raise_for_status()
+                payload = _loads(await resp.read())
+                return payload.get("results", [])
+        except Exception as e:
+            print(f"ERROR: Adzuna page {page} request failed: {str(e)}")
+            return []
+
+    async def _fetch_all():
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            page_results = await asyncio.gather(
+                *(_fetch_page(session, page) for page in pages)
+            )
+        merged = []
+        for results in page_results:
+            merged.extend(results)
+        return merged
+
+    try:
+        return asyncio.run(_fetch_all())
+    except Exception as e:
+        print(f"ERROR: Adzuna multi-page fetch failed: {str(e)}")
+        # Return empty list to trigger fallback in the route
+        return []
+
+
+def fetch_adzuna_jobs_batch(queries, max_workers=8):
+    """
+    Run several heterogeneous fetch_adzuna_jobs queries in parallel.
+
+    Each query is a kwargs dict for fetch_adzuna_jobs (e.g. different
+    countries or salary filters). The work is pure network wait, so a
+    small thread pool over the shared pooled session overlaps the
+    round-trips; results come back in query order, one list per query.
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as ex:
+        return list(ex.map(lambda q: fetch_adzuna_jobs(**q), queries))
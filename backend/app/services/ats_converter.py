@@ -8,7 +8,11 @@ into ATS-friendly formats (DOCX/PDF).
 import re
 import io
 import os
+import json
+import hashlib
+import threading
 from typing import Dict, List, Optional, Tuple
+from cachetools import LRUCache
 from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -22,6 +26,33 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER
 
+# Compiled once at import: every conversion reuses these instead of
+# paying re's pattern-cache hashing/lookup per call
+# Optional linear-time engine for the contact alternation: google-re2
+# compiles it to a DFA, so the scan can't backtrack pathologically on
+# adversarial input. Purely opt-in — stdlib re is the default, and the
+# project/certification patterns below stay on re because re2 doesn't
+# support their lookaheads.
+try:
+    import re2 as _re_linear
+except ImportError:
+    _re_linear = re
+
+_CONTACT_RE = _re_linear.compile(
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)'
+    r'|(?P<phone>(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?P<linkedin>linkedin\.com/in/[\w-]+)'
+)
+_PROJECT_RES = [
+    re.compile(r'(?i)(?:Project|Academic Project):\s*(.*?)(?=\n[A-Z]|$)', re.S),
+    re.compile(r'(?i)PROJECTS\n(.*?)(?=\n[A-Z]|$)', re.S),
+]
+_CERT_RE = re.compile(r'(?i)(?:Certifications|Licenses):\s*(.*?)(?=\n[A-Z]|$)', re.S)
+
+# Shared EMU constant — Pt() builds a fresh Length object per call
+_PT_18 = Pt(18)
+
+
 class ATSConverter:
     """
     Service for converting resumes into highly optimized, ATS-friendly formats.
@@ -45,11 +76,21 @@ class ATSConverter:
         ]
         
         self.soft_skills_keywords = [
-            'Problem Solving', 'Analytical Thinking', 'Team Collaboration', 
+            'Problem Solving', 'Analytical Thinking', 'Team Collaboration',
             'Communication Skills', 'Time Management', 'Leadership', 'Adaptability',
             'Critical Thinking', 'Attention to Detail', 'Emotional Intelligence'
         ]
 
+        # Rendered-DOCX cache: users commonly hit download repeatedly for
+        # the same converted resume, and python-docx rebuilds the whole
+        # XML tree each time. Keyed on a hash of the sections dict; DOCX
+        # output is deterministic so identical sections reuse the bytes.
+        # (PDF output embeds a generation timestamp, so it isn't cached.)
+        # LRUCache is not thread-safe and the singleton is shared across
+        # request threads, so access is serialized by the lock.
+        self._docx_cache = LRUCache(maxsize=64)
+        self._docx_lock = threading.Lock()
+
     def convert_resume(self, text: str, job_keywords: Optional[List[str]] = None) -> Dict:
         """Main conversion workflow."""
         analysis = nlp_analyzer.analyze_resume(text)
@@ -86,13 +127,22 @@ class ATSConverter:
 
     def _extract_and_polish_sections(self, text: str, analysis: Dict) -> Dict:
         """Segment resume into structured fields using NLP and Regex."""
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        name = lines[0] if lines else "CANDIDATE NAME"
+        # Only the first non-empty line is needed for the name, so walk
+        # lazily instead of materializing every stripped line up front
+        name = next(
+            (stripped for line in text.splitlines() if (stripped := line.strip())),
+            "CANDIDATE NAME"
+        )
         
-        # Extract contact info
-        email = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        phone = re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-        linkedin = re.search(r'linkedin\.com/in/[\w-]+', text)
+        # Extract contact info in a single scan: the alternation walks
+        # the text once and m.lastgroup routes each hit, instead of three
+        # separate full-text searches
+        contact_hits = {}
+        for m in _CONTACT_RE.finditer(text):
+            if m.lastgroup not in contact_hits:
+                contact_hits[m.lastgroup] = m.group(0)
+                if len(contact_hits) == 3:
+                    break
         
         # Experience processing
         exp_list = []
@@ -105,14 +155,10 @@ class ATSConverter:
             
         # Projects processing - smarter extraction
         projects = []
-        project_patterns = [
-            r'(?i)(?:Project|Academic Project):\s*(.*?)(?=\n[A-Z]|$)',
-            r'(?i)PROJECTS\n(.*?)(?=\n[A-Z]|$)'
-        ]
-        for pattern in project_patterns:
-            matches = re.findall(pattern, text, re.S)
+        for pattern in _PROJECT_RES:
+            matches = pattern.findall(text)
             for m in matches:
-                p_items = [p.strip() for p in m.split('\n') if p.strip()]
+                p_items = [p.strip() for p in m.splitlines() if p.strip()]
                 projects.extend(p_items[:3])
         if not projects:
             projects = ["Integrated Analysis Hub", "Smart Management System"]
@@ -131,9 +177,9 @@ class ATSConverter:
 
         # Certifications
         certs = []
-        cert_matches = re.findall(r'(?i)(?:Certifications|Licenses):\s*(.*?)(?=\n[A-Z]|$)', text, re.S)
+        cert_matches = _CERT_RE.findall(text)
         if cert_matches:
-            certs = [c.strip() for c in cert_matches[0].split('\n') if c.strip()][:3]
+            certs = [c.strip() for c in cert_matches[0].splitlines() if c.strip()][:3]
         if not certs:
             certs = ["Professional Development Certificate", "Industry Standard Certification"]
 
@@ -150,9 +196,9 @@ class ATSConverter:
             'interests': ["Technology Trends", "Problem Solving"],
             'certifications': certs,
             'contact': {
-                'phone': phone.group(0) if phone else "Contact Phone",
-                'email': email.group(0) if email else "Contact Email",
-                'linkedin': linkedin.group(0) if linkedin else "linkedin.com/in/profile"
+                'phone': contact_hits.get('phone', "Contact Phone"),
+                'email': contact_hits.get('email', "Contact Email"),
+                'linkedin': contact_hits.get('linkedin', "linkedin.com/in/profile")
             }
         }
 
@@ -178,10 +224,15 @@ class ATSConverter:
 
         # 2. Tech Keyword Injection
         if job_keywords:
+            # Lowercase the existing skills once; the old per-keyword list
+            # comprehension re-lowered every skill for every keyword
+            existing_lower = {s.lower() for s in sections['tech_skills']}
             added = 0
             for kw in job_keywords:
-                if kw.lower() not in [s.lower() for s in sections['tech_skills']]:
+                kw_lower = kw.lower()
+                if kw_lower not in existing_lower:
                     sections['tech_skills'].append(kw)
+                    existing_lower.add(kw_lower)
                     added += 1
             if added > 0:
                 improvements.append(f"Injected {added} target industry keywords for 95%+ matching.")
@@ -225,29 +276,46 @@ class ATSConverter:
 
     def _generate_ats_text(self, s: Dict) -> str:
         """Standard linear text for ATS parsing."""
-        text = f"{s['name']}\n{s['contact']['email']} | {s['contact']['phone']} | {s['contact']['linkedin']}\n\n"
-        text += f"PROFESSIONAL SUMMARY\n{s['summary']}\n\n"
-        text += f"TECHNICAL SKILLS\n{', '.join(s['tech_skills'])}\n\n"
-        text += f"PROFESSIONAL EXPERIENCE\n"
+        # Collect fragments and join once at the end: repeated += on a
+        # str reallocates and copies the growing buffer on every append
+        parts = [
+            f"{s['name']}\n{s['contact']['email']} | {s['contact']['phone']} | {s['contact']['linkedin']}\n\n",
+            f"PROFESSIONAL SUMMARY\n{s['summary']}\n\n",
+            f"TECHNICAL SKILLS\n{', '.join(s['tech_skills'])}\n\n",
+            "PROFESSIONAL EXPERIENCE\n",
+        ]
         for e in s['experience']:
-            text += f"{e['title']} | {e['company']} | {e['date']}\n• {e['description']}\n\n"
-        text += f"EDUCATION\n"
+            parts.append(f"{e['title']} | {e['company']} | {e['date']}\n• {e['description']}\n\n")
+        parts.append("EDUCATION\n")
         for ed in s['education']:
             timeline = f"{ed.get('start_year', '')} - {ed.get('end_year', '')}" if ed.get('start_year') else ed.get('end_year', '')
             grade_info = f" | Grade: {ed['grade']}" if ed.get('grade') else ""
-            text += f"{ed['degree']} in {ed.get('field', 'General Studies')} | {ed['institution']} ({timeline}){grade_info}\n"
+            parts.append(f"{ed['degree']} in {ed.get('field', 'General Studies')} | {ed['institution']} ({timeline}){grade_info}\n")
         if s['projects']:
-            text += f"\nPROJECTS\n"
+            parts.append("\nPROJECTS\n")
             for p in s['projects']:
-                text += f"• {p}\n"
+                parts.append(f"• {p}\n")
         if s['certifications']:
-            text += f"\nCERTIFICATIONS\n"
+            parts.append("\nCERTIFICATIONS\n")
             for c in s['certifications']:
-                text += f"• {c}\n"
-        return text
+                parts.append(f"• {c}\n")
+        return ''.join(parts)
 
     def generate_docx(self, s: Dict) -> bytes:
         """Generate high-compatibility, single-column DOCX."""
+        try:
+            cache_key = hashlib.sha256(
+                json.dumps(s, sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()
+        except (TypeError, ValueError):
+            cache_key = None
+
+        if cache_key is not None:
+            with self._docx_lock:
+                cached = self._docx_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         doc = Document()
         
         # Name and Contact
@@ -255,7 +323,7 @@ class ATSConverter:
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run(s['name'])
         run.bold = True
-        run.font.size = Pt(18)
+        run.font.size = _PT_18
         
         contact = doc.add_paragraph()
         contact.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -291,7 +359,11 @@ class ATSConverter:
 
         f = io.BytesIO()
         doc.save(f)
-        return f.getvalue()
+        data = f.getvalue()
+        if cache_key is not None:
+            with self._docx_lock:
+                self._docx_cache[cache_key] = data
+        return data
 
     def generate_pdf(self, s: Dict) -> bytes:
         """Generate high-compatibility, single-column PDF Layout."""
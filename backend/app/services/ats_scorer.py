@@ -19,18 +19,40 @@ Key Features:
 - Keyword gap analysis
 """
 
+import hashlib
 import re
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import threading
+
+import numpy as np
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, NamedTuple, Tuple
+
+from cachetools import LRUCache
 
 from .nlp_analyzer import nlp_analyzer
 
 
-@dataclass
-class ScoreComponent:
+@lru_cache(maxsize=128)
+def _extract_skills_cached(resume_text: str) -> Dict:
+    """NLP skill extraction memoized per resume text.
+
+    Scoring the same resume against several jobs re-runs the most
+    expensive step of the pipeline on identical input; the cache returns
+    the prior result instead. Callers must treat the returned dict as
+    read-only — it is shared between cache hits.
+    """
+    return nlp_analyzer.extract_skills(resume_text)
+
+
+class ScoreComponent(NamedTuple):
     """
     Represents a single component of the ATS score.
-    
+
+    A NamedTuple rather than a dataclass: five are allocated per scoring
+    call and only read back by attribute, so the lighter tuple layout is
+    all that's needed.
+
     Attributes:
         name: Component name (e.g., 'keywords', 'formatting')
         score: Score value (0-100)
@@ -89,6 +111,22 @@ class ATSScorer:
             'spearheaded', 'orchestrated', 'executed', 'transformed'
         ]
         
+        # Frozen keyword sets for single-pass token matching: one
+        # tokenization of the resume plus set intersections replaces a
+        # full-text substring scan per keyword (which also false-matched
+        # inside words, e.g. 'led' in 'filled' or 'mba' in 'combat')
+        self._action_verbs_set = frozenset(self.action_verbs)
+        self._degree_set = frozenset([
+            'bachelor', 'master', 'phd', 'doctorate', 'mba',
+            'b.s.', 'm.s.', 'b.a.', 'm.a.', 'degree'
+        ])
+        self._edu_set = frozenset(['university', 'college', 'institute', 'school'])
+        self._common_kw_set = frozenset([
+            'experience', 'developed', 'managed', 'team', 'project',
+            'skills', 'implemented', 'designed', 'improved', 'led'
+        ])
+        self._token_re = re.compile(r'[a-z.]+')
+
         # Patterns that ATS may have trouble parsing
         self.problematic_patterns = [
             r'[^\x00-\x7F]+',           # Non-ASCII characters
@@ -96,7 +134,50 @@ class ATSScorer:
             r'[\u2022\u2023\u25E6]',     # Fancy bullet points
             r'(?:^|\s)([A-Z]\.){2,}',    # Excessive abbreviations
         ]
+
+        # One alternation over all problematic patterns: a single scan of
+        # the resume replaces up to four, and compiling here keeps re's
+        # pattern-cache lookup off the scoring hot path
+        self._problematic_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.problematic_patterns)
+        )
+        # Single alternation over all section names: one linear scan of
+        # the resume instead of one substring search per section. re
+        # compiles literal alternations into a shared prefix machine.
+        self._sections_re = re.compile(
+            '|'.join(re.escape(s) for s in
+                     sorted(self.required_sections, key=len, reverse=True))
+        )
+        self._email_re = re.compile(r'\b[\w.-]+@[\w.-]+\.\w+\b')
+        self._phone_re = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+        self._metric_re = re.compile(r'\d+%|\$\d+|\d+\+')
+        self._year_re = re.compile(r'(19|20)\d{2}')
+        self._grade_re = re.compile(r'(\b\d\.\d{1,2}\b|\b\d{2,3}%)')
+
+        # Full-result cache: scoring is deterministic in its inputs, and
+        # re-scoring the same resume/JD pair (page refreshes, batch runs)
+        # is common. Keyed on fast BLAKE2 digests of the texts so huge
+        # resume strings aren't held as dict keys. LRUCache is not
+        # thread-safe (even get() reorders entries), and the singleton
+        # is shared across request and executor threads, so all access
+        # goes through the lock.
+        self._score_cache = LRUCache(maxsize=256)
+        self._score_lock = threading.Lock()
     
+    def _tokenize(self, text_lower: str) -> set:
+        """Split lowercased text into a word-token set for set matching.
+
+        Dotted forms are kept as-is (so 'b.s.' survives) and also added
+        stripped of edge dots (so 'skills.' still matches 'skills').
+        """
+        tokens = set()
+        for tok in self._token_re.findall(text_lower):
+            tokens.add(tok)
+            stripped = tok.strip('.')
+            if stripped:
+                tokens.add(stripped)
+        return tokens
+
     def calculate_ats_score(
         self, 
         resume_text: str, 
@@ -123,12 +204,36 @@ class ATSScorer:
             for rec in result['recommendations']:
                 print(f"- {rec}")
         """
+        # Return the memoized result for a repeat resume/JD pair before
+        # doing any NLP or regex work. Cached dicts are shared between
+        # hits, so callers must not mutate them.
+        cache_key = (
+            hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).hexdigest(),
+            hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).hexdigest(),
+            tuple(job_keywords) if job_keywords else None
+        )
+        with self._score_lock:
+            cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Shared per-call context: every component scorer used to lower(),
+        # split() and tokenize the same resume independently (and two of
+        # them re-ran NLP skill extraction). Compute each once here and
+        # hand the precomputed values to the components.
+        ctx = {
+            'lower': resume_text.lower(),
+            'word_count': len(resume_text.split()),
+        }
+        ctx['tokens'] = self._tokenize(ctx['lower'])
+        ctx['resume_skills'] = _extract_skills_cached(resume_text)
+
         # Calculate individual component scores
-        keyword_score = self._score_keywords(resume_text, job_description, job_keywords)
-        format_score = self._score_formatting(resume_text)
-        experience_score = self._score_experience(resume_text)
-        education_score = self._score_education(resume_text)
-        skills_score = self._score_skills(resume_text)
+        keyword_score = self._score_keywords(resume_text, ctx, job_description, job_keywords)
+        format_score = self._score_formatting(resume_text, ctx)
+        experience_score = self._score_experience(resume_text, ctx)
+        education_score = self._score_education(resume_text, ctx)
+        skills_score = self._score_skills(resume_text, ctx)
         
         # Create score components
         components = [
@@ -179,7 +284,7 @@ class ATSScorer:
             for c in components
         }
         
-        return {
+        result = {
             'overall_score': overall_score,
             'breakdown': breakdown,
             'recommendations': recommendations,
@@ -187,30 +292,80 @@ class ATSScorer:
             'score_label': score_label,
             'is_highly_optimized': is_highly_optimized
         }
-    
-    def _score_keywords(self, resume_text: str, job_description: str = "", job_keywords: List[str] = None) -> Dict:
+        with self._score_lock:
+            self._score_cache[cache_key] = result
+        return result
+
+    def calculate_ats_score_batch(
+        self,
+        resume_texts: List[str],
+        job_description: str = "",
+        job_keywords: List[str] = None,
+        top_k: int = None
+    ) -> List[Dict]:
+        """
+        Score many resumes against one job description and rank them.
+
+        Bulk mode for evaluating a pool of candidates: per-resume NLP
+        and regex work still runs in Python (it cannot be vectorized),
+        but the ranking over N results is a single NumPy argsort on an
+        integer array instead of sorting Python dicts. Duplicate texts
+        in the batch hit the score cache, so they cost one lookup.
+
+        Args:
+            resume_texts: Resume contents to score
+            job_description: Job description shared by the whole batch
+            job_keywords: Optional explicit keyword list
+            top_k: If given, return only the K best resumes
+
+        Returns:
+            List of scoring results ordered best-first, each with an
+            'index' field pointing back into resume_texts.
+        """
+        if not resume_texts:
+            return []
+
+        results = [
+            self.calculate_ats_score(text, job_description, job_keywords)
+            for text in resume_texts
+        ]
+
+        overall = np.fromiter(
+            (r['overall_score'] for r in results),
+            dtype=np.int32, count=len(results)
+        )
+        order = np.argsort(-overall, kind='stable')
+        if top_k is not None:
+            order = order[:top_k]
+
+        return [{'index': int(i), **results[i]} for i in order]
+
+    def _score_keywords(self, resume_text: str, ctx: Dict, job_description: str = "", job_keywords: List[str] = None) -> Dict:
         """
         Score keyword optimization.
-        
+
         Analyzes how well the resume matches keywords from the job description or keyword list.
         """
-        resume_lower = resume_text.lower()
-        
+        resume_lower = ctx['lower']
+
         target_keywords = set()
         if job_keywords:
             target_keywords.update(kw.lower() for kw in job_keywords)
         
         if job_description:
             job_skills = nlp_analyzer.extract_skills(job_description)
-            for cat in job_skills.values():
-                target_keywords.update(s.lower() for s in cat['skills'])
-        
+            target_keywords.update(
+                s.lower() for s in
+                chain.from_iterable(cat['skills'] for cat in job_skills.values())
+            )
+
         if target_keywords:
-            # Extract skills from resume
-            resume_skills = nlp_analyzer.extract_skills(resume_text)
-            resume_skills_flat = set()
-            for cat in resume_skills.values():
-                resume_skills_flat.update(s.lower() for s in cat['skills'])
+            # Resume skills were already extracted once in calculate_ats_score;
+            # flatten the category lists in one chained pass
+            resume_skills_flat = {
+                s.lower() for s in
+                chain.from_iterable(cat['skills'] for cat in ctx['resume_skills'].values())
+            }
             
             # Simple word match as fallback/supplement
             for kw in target_keywords:
@@ -239,12 +394,7 @@ class ATSScorer:
         
         else:
             # Score based on general keyword presence
-            common_keywords = [
-                'experience', 'developed', 'managed', 'team', 'project',
-                'skills', 'implemented', 'designed', 'improved', 'led'
-            ]
-            
-            found = sum(1 for kw in common_keywords if kw in resume_lower)
+            found = len(ctx['tokens'] & self._common_kw_set)
             score = min(100, found * 10 + 40)
             analysis = {'general_keywords_found': found}
             feedback = "Add job-specific keywords for better matching"
@@ -255,7 +405,7 @@ class ATSScorer:
             'analysis': analysis
         }
     
-    def _score_formatting(self, resume_text: str) -> Dict:
+    def _score_formatting(self, resume_text: str, ctx: Dict) -> Dict:
         """
         Score resume formatting and structure against ATS standards.
         Checks for:
@@ -265,7 +415,7 @@ class ATSScorer:
         """
         score = 100
         issues = []
-        text_lower = resume_text.lower()
+        text_lower = ctx['lower']
         
         # 1. Detect Tables/Columns (Common ATS pitfalls)
         # We look for pipe characters, excessive tabs, or specific alignment markers
@@ -274,30 +424,25 @@ class ATSScorer:
             issues.append("Avoid using tables or multi-column layouts; they confuse ATS")
         
         # 2. Check for required sections (Structure)
-        sections_found = sum(1 for section in self.required_sections if section in text_lower)
+        sections_found = len(set(self._sections_re.findall(text_lower)))
         if sections_found < 4:
             score -= 25
             issues.append("Resume structure is missing key sections (Work Experience, Education, or Skills)")
         
         # 3. Detect Problematic Characters (Graphics/Icons)
-        problem_found = False
-        for pattern in self.problematic_patterns:
-            if re.search(pattern, resume_text):
-                problem_found = True
-                break
-        if problem_found:
+        if self._problematic_re.search(resume_text):
             score -= 15
             issues.append("Remove icons, graphics, or non-standard characters")
             
         # 4. Contact Info Check
-        has_email = bool(re.search(r'\b[\w.-]+@[\w.-]+\.\w+\b', resume_text))
-        has_phone = bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', resume_text))
+        has_email = bool(self._email_re.search(resume_text))
+        has_phone = bool(self._phone_re.search(resume_text))
         if not has_email or not has_phone:
             score -= 15
             issues.append("Essential contact information (Email/Phone) is missing or hard to read")
             
         # 5. Length Check
-        word_count = len(resume_text.split())
+        word_count = ctx['word_count']
         if word_count < 300:
             score -= 15
             issues.append("Resume content is too brief to provide context")
@@ -314,29 +459,26 @@ class ATSScorer:
         
         return {'score': score, 'feedback': feedback}
     
-    def _score_experience(self, resume_text: str) -> Dict:
+    def _score_experience(self, resume_text: str, ctx: Dict) -> Dict:
         """
         Score work experience section.
-        
+
         Evaluates:
         - Use of action verbs
         - Quantifiable achievements
         - Chronological clarity
-        
+
         Args:
             resume_text: Resume content
-        
+            ctx: Precomputed context from calculate_ats_score
+
         Returns:
             Dict with score and feedback
         """
-        text_lower = resume_text.lower()
         score = 60  # Base score
-        
-        # Check for action verbs
-        action_verb_count = sum(
-            1 for verb in self.action_verbs 
-            if verb in text_lower
-        )
+
+        # Check for action verbs (whole-word matches via token set)
+        action_verb_count = len(ctx['tokens'] & self._action_verbs_set)
         
         if action_verb_count >= 8:
             score += 25
@@ -348,7 +490,7 @@ class ATSScorer:
             feedback = "Add more action verbs to describe achievements"
         
         # Check for quantifiable achievements (numbers, percentages)
-        numbers = re.findall(r'\d+%|\$\d+|\d+\+', resume_text)
+        numbers = self._metric_re.findall(resume_text)
         if len(numbers) >= 3:
             score += 15
             feedback = "Excellent use of quantifiable metrics"
@@ -359,49 +501,42 @@ class ATSScorer:
         
         return {'score': score, 'feedback': feedback}
     
-    def _score_education(self, resume_text: str) -> Dict:
+    def _score_education(self, resume_text: str, ctx: Dict) -> Dict:
         """
         Score education section.
-        
+
         Checks for:
         - Degree mentions
         - Institution names
         - Graduation years
-        
+
         Args:
             resume_text: Resume content
-        
+            ctx: Precomputed context from calculate_ats_score
+
         Returns:
             Dict with score and feedback
         """
-        text_lower = resume_text.lower()
         score = 50  # Base score
-        
-        # Check for degree keywords
-        degree_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'mba',
-            'b.s.', 'm.s.', 'b.a.', 'm.a.', 'degree'
-        ]
-        
-        has_degree = any(kw in text_lower for kw in degree_keywords)
+
+        # Check for degree and education keywords via the shared token set
+        tokens = ctx['tokens']
+        has_degree = not self._degree_set.isdisjoint(tokens)
         if has_degree:
             score += 30
-        
+
         # Check for education-related words
-        edu_keywords = ['university', 'college', 'institute', 'school']
-        has_institution = any(kw in text_lower for kw in edu_keywords)
+        has_institution = not self._edu_set.isdisjoint(tokens)
         if has_institution:
             score += 15
         
         # Check for graduation year
-        year_pattern = r'(19|20)\d{2}'
-        has_year = bool(re.search(year_pattern, resume_text))
+        has_year = bool(self._year_re.search(resume_text))
         if has_year:
             score += 5
 
         # Check for GPA/Grade/Percentage
-        grade_pattern = r'(\b\d\.\d{1,2}\b|\b\d{2,3}%)'
-        has_grade = bool(re.search(grade_pattern, resume_text))
+        has_grade = bool(self._grade_re.search(resume_text))
         if has_grade:
             score += 5
             
@@ -416,19 +551,20 @@ class ATSScorer:
         
         return {'score': min(100, score), 'feedback': feedback}
     
-    def _score_skills(self, resume_text: str) -> Dict:
+    def _score_skills(self, resume_text: str, ctx: Dict) -> Dict:
         """
         Score technical and soft skills section.
-        
-        Uses NLP analyzer to extract and count skills.
-        
+
+        Uses the NLP skill extraction shared via the scoring context.
+
         Args:
             resume_text: Resume content
-        
+            ctx: Precomputed context from calculate_ats_score
+
         Returns:
             Dict with score and feedback
         """
-        skills = nlp_analyzer.extract_skills(resume_text)
+        skills = ctx['resume_skills']
         
         total_skills = sum(cat['count'] for cat in skills.values())
         
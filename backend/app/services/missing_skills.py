@@ -12,11 +12,18 @@ Key Features:
 - Calculate match percentage
 """
 
+import hashlib
 import re
 import random
+import sys
+import threading
+from bisect import bisect_left
+from heapq import nsmallest
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
 
+from cachetools import LRUCache
+
 
 class MissingSkillsAnalyzer:
     """
@@ -36,7 +43,18 @@ class MissingSkillsAnalyzer:
         print(f"Match: {result['match_percentage']}%")
         print(f"Missing critical: {result['critical']}")
     """
-    
+
+    # The module-level singleton is shared by every request thread, so
+    # its state must stay read-only after __init__; __slots__ drops the
+    # per-instance __dict__ and keeps attribute reads on the fast path
+    __slots__ = (
+        'skills_database', 'required_keywords', 'preferred_keywords',
+        'category_skills', '_soft_skills_set', '_boundary_chars',
+        '_automaton', '_lower_to_skill', '_skills_re', '_prefix_skills',
+        '_category_skill_pairs', '_req_kw_re', '_pref_kw_re', '_skill_lower',
+        '_vocab_char_mask', '_job_cache', '_job_lock'
+    )
+
     def __init__(self):
         """Initialize the analyzer with skill databases."""
         
@@ -136,17 +154,94 @@ class MissingSkillsAnalyzer:
         }
         
         # Keywords that indicate required vs preferred skills
-        self.required_keywords = [
+        # (tuples: shared singleton state must not be mutated per call)
+        self.required_keywords = (
             'required', 'must have', 'must-have', 'essential',
             'mandatory', 'necessary', 'need to have', 'requirements',
             'qualifications', 'you have', 'you bring'
-        ]
-        
-        self.preferred_keywords = [
+        )
+
+        self.preferred_keywords = (
             'preferred', 'nice to have', 'nice-to-have', 'bonus',
             'plus', 'advantage', 'ideally', 'optional', 'desired',
             'good to have', 'beneficial'
-        ]
+        )
+
+        # Lowercased form of every vocabulary skill, interned and built
+        # once: the analysis loops look these up instead of calling
+        # skill.lower() (a fresh allocation) per skill per request
+        self._skill_lower = {
+            sys.intern(skill): sys.intern(skill.lower())
+            for skills in self.skills_database.values()
+            for skill in skills
+        }
+
+        # 64-bit character mask over the whole vocabulary: a text whose
+        # characters share no bits with it cannot contain any skill, so
+        # extraction can bail before running either matcher. Catches
+        # noise inputs (whitespace, punctuation-only) at near-zero cost.
+        self._vocab_char_mask = 0
+        for skill_lower in self._skill_lower.values():
+            for ch in skill_lower:
+                self._vocab_char_mask |= 1 << (ord(ch) & 63)
+
+        # Compiled keyword alternations (longest-first): finditer yields
+        # every occurrence of every importance keyword in one scan,
+        # where per-keyword find() only ever saw the first occurrence —
+        # a skill listed near a later 'Requirements:' section was missed
+        self._req_kw_re = re.compile('|'.join(
+            re.escape(k) for k in
+            sorted(self.required_keywords, key=len, reverse=True)))
+        self._pref_kw_re = re.compile('|'.join(
+            re.escape(k) for k in
+            sorted(self.preferred_keywords, key=len, reverse=True)))
+
+        # Hashed membership for the soft-skill checks: the categorizer
+        # tests every found skill against this list, and a frozenset
+        # lookup is O(1) where the list scan was O(21)
+        self._soft_skills_set = frozenset(self.skills_database['soft_skills'])
+
+        # Single-pass skill matcher: an Aho-Corasick automaton over the
+        # whole vocabulary finds every skill mention in one scan of the
+        # text, instead of one regex search per skill (~250 full-text
+        # scans per call). pyahocorasick is pinned in requirements, but
+        # _extract_skills_from_text still falls back to the regex loop
+        # if the C extension is missing from the environment.
+        # The character set mirrors the regex class [\s,;:()\[\]./], so
+        # every \s member (including \r from CRLF text) is a boundary.
+        self._boundary_chars = frozenset(' \t\n\r\f\v,;:()[]./')
+        try:
+            import ahocorasick
+            self._automaton = ahocorasick.Automaton()
+            for category, skills in self.skills_database.items():
+                for skill in skills:
+                    self._automaton.add_word(skill.lower(), (skill.lower(), skill))
+            self._automaton.make_automaton()
+        except ImportError:
+            self._automaton = None
+            # Fallback path: one compiled alternation over the whole
+            # vocabulary, so extraction is a single scan of the text
+            # instead of one precompiled search per skill. The capture
+            # sits in a lookahead so matches don't consume text (a hit
+            # for 'ruby on rails' must not hide the 'rails' inside it),
+            # and alternatives are longest-first so the regex always
+            # reports the longest skill at a position; shorter skills
+            # that are prefixes of it (e.g. 'react' in 'react.js') are
+            # recovered via the precomputed prefix map below.
+            self._lower_to_skill = {}
+            for skills in self.skills_database.values():
+                for skill in skills:
+                    self._lower_to_skill.setdefault(skill.lower(), skill)
+            sorted_lowers = sorted(self._lower_to_skill, key=len, reverse=True)
+            self._skills_re = re.compile(
+                r'(?:^|[\s,;:()\[\]./])(?=('
+                + '|'.join(re.escape(s) for s in sorted_lowers)
+                + r'))'
+            )
+            self._prefix_skills = {
+                s: [p for p in self._lower_to_skill if p != s and s.startswith(p)]
+                for s in self._lower_to_skill
+            }
 
         # Category-specific default skills for fallback analysis
         self.category_skills = {
@@ -176,20 +271,40 @@ class MissingSkillsAnalyzer:
                 'soft': ['Leadership', 'Collaboration', 'Adaptability', 'Emotional Intelligence', 'Active Listening']
             }
         }
-    
+
+        # Job descriptions repeat across candidates, so the JD-dependent
+        # work (extraction + categorization) is memoized by text digest;
+        # same pattern as the ATS scorer's result cache. LRUCache is
+        # not thread-safe and this singleton is shared across request
+        # and executor threads, so access is serialized by the lock.
+        self._job_cache = LRUCache(maxsize=128)
+        self._job_lock = threading.Lock()
+
+        # Default-suggestion skills paired with their lowercased forms
+        # once, so the fallback path doesn't re-lowercase the fixed
+        # lists on every call
+        self._category_skill_pairs = {
+            cat: {bucket: tuple((s, s.lower()) for s in skills)
+                  for bucket, skills in data.items()}
+            for cat, data in self.category_skills.items()
+        }
+
     def analyze(
         self,
         resume_skills: List[str],
         job_description: str,
-        category: str = "Professional"
+        category: str = "Professional",
+        resume_skills_lower: Set[str] = None
     ) -> Dict:
         """
         Analyze missing skills between resume and job description.
-        
+
         Args:
             resume_skills: List of skills extracted from resume
             job_description: Target job description text
-        
+            resume_skills_lower: Optional pre-lowercased skill set;
+                callers looping over jobs can lowercase once and reuse
+
         Returns:
             Dict containing:
                 - critical: List of critical missing skills
@@ -203,46 +318,32 @@ class MissingSkillsAnalyzer:
         """
         # Handle empty job description
         if not job_description or len(job_description.strip()) < 20:
-            return self._get_default_suggestions(resume_skills, category)
-        
+            return self._get_default_suggestions(
+                resume_skills, category, resume_skills_lower)
+
         # Normalize resume skills to lowercase for comparison
-        resume_skills_lower = set(skill.lower() for skill in resume_skills)
-        
-        # Extract skills from job description
-        job_skills = self._extract_skills_from_text(job_description)
-        
-        # Categorize job skills by importance
-        categorized_job_skills = self._categorize_by_importance(
-            job_skills,
+        if resume_skills_lower is None:
+            resume_skills_lower = set(skill.lower() for skill in resume_skills)
+
+        # Extract and categorize job skills (memoized per description)
+        job_skills, categorized_job_skills, proximity = self._analyze_job(
             job_description
         )
         
-        # Find missing skills
-        missing_critical = []
-        missing_recommended = []
-        missing_soft = []
+        # Find missing skills: one pass over the three importance
+        # buckets, splitting matched vs missing by set membership
+        missing = {'critical': [], 'recommended': [], 'soft': []}
         matched_skills = []
-        
-        # Check critical skills
-        for skill in categorized_job_skills['critical']:
-            if skill.lower() in resume_skills_lower:
-                matched_skills.append(skill)
-            else:
-                missing_critical.append(skill)
-        
-        # Check recommended skills
-        for skill in categorized_job_skills['recommended']:
-            if skill.lower() in resume_skills_lower:
-                matched_skills.append(skill)
-            else:
-                missing_recommended.append(skill)
-        
-        # Check soft skills
-        for skill in categorized_job_skills['soft']:
-            if skill.lower() in resume_skills_lower:
-                matched_skills.append(skill)
-            else:
-                missing_soft.append(skill)
+
+        for bucket, bucket_skills in categorized_job_skills.items():
+            missing_bucket = missing[bucket]
+            for skill in bucket_skills:
+                # extraction only yields database entries, so the
+                # precomputed lowercase map always has the skill
+                if self._skill_lower[skill] in resume_skills_lower:
+                    matched_skills.append(skill)
+                else:
+                    missing_bucket.append(skill)
         
         # Calculate match percentage
         total_job_skills = len(job_skills)
@@ -253,93 +354,239 @@ class MissingSkillsAnalyzer:
         else:
             match_percentage = 0
         
+        # Surface the missing skills closest to an importance keyword
+        # first: bounded heap selection rather than sort-then-slice
         return {
-            'critical': missing_critical[:10],
-            'recommended': missing_recommended[:8],
-            'soft': missing_soft[:5],
+            'critical': nsmallest(10, missing['critical'], key=proximity.get),
+            'recommended': nsmallest(8, missing['recommended'], key=proximity.get),
+            'soft': missing['soft'][:5],
             'match_percentage': match_percentage,
             'total_job_skills': total_job_skills,
             'matched_skills': matched_count,
             'matched_skills_list': matched_skills,
             'has_job_description': True
         }
-    
-    def _extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract skills mentioned in text using pattern matching."""
-        text_lower = text.lower()
+
+    def analyze_batch(
+        self,
+        resume_skills_lists: List[List[str]],
+        job_description: str,
+        category: str = "Professional"
+    ) -> List[Dict]:
+        """
+        Analyze many resumes against one job description.
+
+        Batch mode for ranking a candidate pool: the job-side work —
+        skill extraction and importance categorization, which scan the
+        job description — runs once for the whole batch instead of once
+        per resume. Each resume then only pays for its own hashed
+        membership checks.
+
+        Args:
+            resume_skills_lists: One skill list per resume
+            job_description: Job description shared by the batch
+
+        Returns:
+            One analyze()-shaped result dict per resume, in input order.
+        """
+        if not job_description or len(job_description.strip()) < 20:
+            return [self._get_default_suggestions(skills, category)
+                    for skills in resume_skills_lists]
+
+        job_skills, categorized_job_skills, proximity = self._analyze_job(
+            job_description
+        )
+        # Pair each job skill with its precomputed lowercased form once,
+        # rather than re-lowercasing per resume in the loop below
+        buckets = {
+            bucket: [(skill, self._skill_lower[skill]) for skill in bucket_skills]
+            for bucket, bucket_skills in categorized_job_skills.items()
+        }
+        total_job_skills = len(job_skills)
+
+        results = []
+        for resume_skills in resume_skills_lists:
+            resume_skills_lower = set(skill.lower() for skill in resume_skills)
+            missing = {'critical': [], 'recommended': [], 'soft': []}
+            matched_skills = []
+
+            for bucket, pairs in buckets.items():
+                missing_bucket = missing[bucket]
+                for skill, skill_lower in pairs:
+                    if skill_lower in resume_skills_lower:
+                        matched_skills.append(skill)
+                    else:
+                        missing_bucket.append(skill)
+
+            matched_count = len(matched_skills)
+            if total_job_skills > 0:
+                match_percentage = round((matched_count / total_job_skills) * 100)
+            else:
+                match_percentage = 0
+
+            results.append({
+                'critical': nsmallest(10, missing['critical'], key=proximity.get),
+                'recommended': nsmallest(8, missing['recommended'], key=proximity.get),
+                'soft': missing['soft'][:5],
+                'match_percentage': match_percentage,
+                'total_job_skills': total_job_skills,
+                'matched_skills': matched_count,
+                'matched_skills_list': matched_skills,
+                'has_job_description': True
+            })
+
+        return results
+
+    def _analyze_job(
+        self,
+        job_description: str
+    ) -> Tuple[List[str], Dict[str, List[str]], Dict[str, float]]:
+        """
+        Job-description-dependent half of the analysis, memoized.
+
+        The same job description is typically analyzed against many
+        resumes back to back; extraction and categorization only depend
+        on the description, so repeats are served from the digest-keyed
+        cache. Callers must treat the returned structures as read-only.
+        """
+        cache_key = hashlib.blake2b(
+            job_description.encode('utf-8'), digest_size=16
+        ).hexdigest()
+        with self._job_lock:
+            cached = self._job_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Lowercase the job description once; extraction and
+        # categorization each used to build their own full-size copy
+        text_lower = job_description.lower()
+        job_skills = self._extract_skills_from_text(text_lower)
+        categorized_job_skills, proximity = self._categorize_by_importance(
+            job_skills,
+            text_lower
+        )
+
+        result = (job_skills, categorized_job_skills, proximity)
+        with self._job_lock:
+            self._job_cache[cache_key] = result
+        return result
+
+    def _extract_skills_from_text(self, text_lower: str) -> List[str]:
+        """Extract skills mentioned in already-lowercased text."""
+        # Cheap rejection gate: if no character of the text appears in
+        # any vocabulary skill, neither matcher can possibly hit
+        text_char_mask = 0
+        for ch in set(text_lower):
+            text_char_mask |= 1 << (ord(ch) & 63)
+        if not text_char_mask & self._vocab_char_mask:
+            return []
+
         found_skills = set()
-        
-        for category, skills in self.skills_database.items():
-            for skill in skills:
-                skill_pattern = re.escape(skill.lower())
-                pattern = r'(?:^|[\s,;:()\[\]./])' + skill_pattern + r'(?:[\s,;:()\[\]./]|$)'
-                if re.search(pattern, text_lower):
+
+        if self._automaton is not None:
+            # One linear pass; boundary characters are checked manually
+            # to keep the whole-word semantics of the regex fallback
+            n = len(text_lower)
+            for end, (skill_lower, skill) in self._automaton.iter(text_lower):
+                start = end - len(skill_lower) + 1
+                left_ok = start == 0 or text_lower[start - 1] in self._boundary_chars
+                right_ok = end == n - 1 or text_lower[end + 1] in self._boundary_chars
+                if left_ok and right_ok:
                     found_skills.add(skill)
-        
+            return list(found_skills)
+
+        # Single alternation scan; each boundary-preceded hit reports the
+        # longest matching skill, and its prefix skills are re-checked
+        # against the character after them for the same word boundary
+        n = len(text_lower)
+        for m in self._skills_re.finditer(text_lower):
+            start = m.start(1)
+            longest = m.group(1)
+            for cand in (longest, *self._prefix_skills[longest]):
+                end = start + len(cand)
+                if end == n or text_lower[end] in self._boundary_chars:
+                    found_skills.add(self._lower_to_skill[cand])
+
         return list(found_skills)
     
+    @staticmethod
+    def _nearest_distance(positions: List[int], skill_pos: int) -> float:
+        """Distance to the closest position (bisect lookup); inf if none."""
+        i = bisect_left(positions, skill_pos)
+        best = float('inf')
+        for j in (i - 1, i):
+            if 0 <= j < len(positions):
+                best = min(best, abs(skill_pos - positions[j]))
+        return best
+
     def _categorize_by_importance(
         self,
         skills: List[str],
-        job_description: str
-    ) -> Dict[str, List[str]]:
-        """Categorize skills by importance level."""
-        text_lower = job_description.lower()
+        text_lower: str
+    ) -> Tuple[Dict[str, List[str]], Dict[str, float]]:
+        """Categorize skills by importance level (text pre-lowercased).
+
+        Returns the importance buckets plus a proximity map: each
+        non-soft skill's distance to the nearest importance keyword,
+        used by analyze to rank which missing skills to surface first.
+        """
         critical = []
         recommended = []
         soft = []
-        
+
+        # Locate every importance keyword occurrence up front: one scan
+        # per alternation instead of a find() per keyword per skill.
+        # finditer yields matches in ascending order, so the position
+        # lists are already sorted for the bisect lookups below.
+        req_positions = [m.start() for m in self._req_kw_re.finditer(text_lower)]
+        pref_positions = [m.start() for m in self._pref_kw_re.finditer(text_lower)]
+
+        proximity = {}
         for skill in skills:
-            skill_lower = skill.lower()
-            if skill in self.skills_database.get('soft_skills', []):
+            skill_lower = self._skill_lower[skill]
+            if skill in self._soft_skills_set:
                 soft.append(skill)
                 continue
-            
-            is_critical = False
-            is_recommended = False
-            skill_pattern = re.escape(skill_lower)
-            
-            for keyword in self.required_keywords:
-                keyword_pos = text_lower.find(keyword)
-                if keyword_pos != -1:
-                    skill_match = re.search(skill_pattern, text_lower)
-                    if skill_match and abs(skill_match.start() - keyword_pos) < 300:
-                        is_critical = True
-                        break
-            
-            if not is_critical:
-                for keyword in self.preferred_keywords:
-                    keyword_pos = text_lower.find(keyword)
-                    if keyword_pos != -1:
-                        skill_match = re.search(skill_pattern, text_lower)
-                        if skill_match and abs(skill_match.start() - keyword_pos) < 300:
-                            is_recommended = True
-                            break
-            
-            if is_critical:
+
+            skill_pos = text_lower.find(skill_lower)
+            if skill_pos != -1:
+                req_dist = self._nearest_distance(req_positions, skill_pos)
+                pref_dist = self._nearest_distance(pref_positions, skill_pos)
+            else:
+                req_dist = pref_dist = float('inf')
+            proximity[skill] = min(req_dist, pref_dist)
+
+            if req_dist < 300:
                 critical.append(skill)
-            elif is_recommended:
+            elif pref_dist < 300:
                 recommended.append(skill)
             else:
-                if skill not in self.skills_database.get('soft_skills', []):
+                if skill not in self._soft_skills_set:
                     critical.append(skill)
                 else:
                     soft.append(skill)
-        
+
         return {
             'critical': critical,
             'recommended': recommended,
             'soft': soft
-        }
+        }, proximity
 
-    def _get_default_suggestions(self, resume_skills: List[str], category: str = "Professional") -> Dict:
+    def _get_default_suggestions(
+        self,
+        resume_skills: List[str],
+        category: str = "Professional",
+        resume_skills_lower: Set[str] = None
+    ) -> Dict:
         """Get default skill suggestions when no job description provided."""
-        resume_skills_lower = set(skill.lower() for skill in resume_skills)
-        cat_data = self.category_skills.get(category, self.category_skills['Professional'])
-        
-        avail_critical = [s for s in cat_data['critical'] if s.lower() not in resume_skills_lower]
-        avail_recommended = [s for s in cat_data['recommended'] if s.lower() not in resume_skills_lower]
-        avail_soft = [s for s in cat_data['soft'] if s.lower() not in resume_skills_lower]
+        if resume_skills_lower is None:
+            resume_skills_lower = set(skill.lower() for skill in resume_skills)
+        cat_pairs = self._category_skill_pairs.get(
+            category, self._category_skill_pairs['Professional'])
+
+        avail_critical = [s for s, sl in cat_pairs['critical'] if sl not in resume_skills_lower]
+        avail_recommended = [s for s, sl in cat_pairs['recommended'] if sl not in resume_skills_lower]
+        avail_soft = [s for s, sl in cat_pairs['soft'] if sl not in resume_skills_lower]
         
         # Randomly sample to provide variety and address "static" request
         missing_critical = random.sample(avail_critical, min(len(avail_critical), 7))
@@ -64,21 +64,52 @@ class NLPResumeAnalyzer:
             OSError: If the spaCy model is not installed
         """
         # Load the spaCy English language model
-        # 'en_core_web_lg' is a large model with word vectors
+        # 'en_core_web_lg' is a large model with word vectors.
+        # Only NER (ORG/DATE entities) and the PhraseMatcher are used,
+        # so the tagger, parser, lemmatizer and attribute_ruler are
+        # disabled at load time — they dominate pipeline CPU time and
+        # contribute nothing to the extractions below
+        unused_components = ['parser', 'tagger', 'lemmatizer', 'attribute_ruler']
         try:
-            self.nlp = spacy.load(model_name)
+            self.nlp = spacy.load(model_name, disable=unused_components)
         except OSError:
             # If model not found, download it
             print(f"Downloading spaCy model: {model_name}")
             spacy.cli.download(model_name)
-            self.nlp = spacy.load(model_name)
+            self.nlp = spacy.load(model_name, disable=unused_components)
         
         # Initialize the skill database with categorized skills
         self.skill_database = self._initialize_skill_database()
         
         # Create phrase matcher for skill detection
         self.skill_matcher = self._create_skill_matcher()
-        
+
+        # Characters treated as word boundaries by the Aho-Corasick
+        # fast path below (approximates the matcher's token boundaries;
+        # includes every \s member so CRLF text still splits words)
+        self._boundary_chars = frozenset(' \t\n\r\f\v,;:()[]./')
+
+        # C-backed Aho-Corasick automaton over the flat skill list: one
+        # linear scan of the text, independent of vocabulary size, with
+        # no Doc construction at all. pyahocorasick is pinned in
+        # requirements, so this is the path deployed installs take; the
+        # PhraseMatcher above stays as the fallback if the C extension
+        # is missing from the environment.
+        try:
+            import ahocorasick
+            # Some skills appear in several categories (e.g. Docker), so
+            # each automaton entry carries the full category list
+            skill_categories = {}
+            for category, skills in self.skill_database.items():
+                for skill in skills:
+                    skill_categories.setdefault(skill.lower(), []).append(category)
+            self._skill_automaton = ahocorasick.Automaton()
+            for skill_lower, categories in skill_categories.items():
+                self._skill_automaton.add_word(skill_lower, (skill_lower, categories))
+            self._skill_automaton.make_automaton()
+        except ImportError:
+            self._skill_automaton = None
+
         # Load English stopwords for text cleaning
         self.stopwords = set(stopwords.words('english'))
     
@@ -212,12 +243,54 @@ class NLPResumeAnalyzer:
                 }
             }
         """
-        # Process text with spaCy NLP pipeline
-        doc = self.nlp(text.lower())
-        
+        # Fast path: single linear automaton scan over the raw text,
+        # skipping spaCy entirely
+        if self._skill_automaton is not None:
+            return self._extract_skills_automaton(text.lower())
+
+        # Tokenize only — the PhraseMatcher matches on the LOWER token
+        # attribute, so skill extraction needs no pipeline components
+        # (not even NER) and make_doc skips them entirely
+        doc = self.nlp.make_doc(text.lower())
+        return self._extract_skills_from_doc(doc)
+
+    def _extract_skills_automaton(self, text_lower: str) -> Dict[str, Dict]:
+        """
+        Extract skills via the Aho-Corasick automaton.
+
+        The automaton reports every substring match, so each hit is
+        post-filtered with a boundary-character check to keep only
+        whole-word matches (e.g. 'Java' inside 'JavaScript' is dropped).
+        """
+        categorized_skills = {}
+        last = len(text_lower) - 1
+
+        for end, (skill_lower, categories) in self._skill_automaton.iter(text_lower):
+            start = end - len(skill_lower) + 1
+            # Reject matches embedded inside a longer word
+            if start > 0 and text_lower[start - 1] not in self._boundary_chars:
+                continue
+            if end < last and text_lower[end + 1] not in self._boundary_chars:
+                continue
+            # Same .title() normalization as the matcher path
+            skill = skill_lower.title()
+            for category in categories:
+                categorized_skills.setdefault(category, set()).add(skill)
+
+        return self._score_categorized_skills(categorized_skills)
+
+    def _extract_skills_from_doc(self, doc) -> Dict[str, Dict]:
+        """
+        Extract skills from an already-parsed spaCy Doc.
+
+        The PhraseMatcher matches on the LOWER attribute, so it works on
+        a Doc of any casing — this lets analyze_resume reuse one parsed
+        Doc for skills, experience and education instead of running the
+        pipeline once per extraction.
+        """
         # Find all skill matches
         matches = self.skill_matcher(doc)
-        
+
         # Organize matches by category
         categorized_skills = {}
         
@@ -234,7 +307,16 @@ class NLPResumeAnalyzer:
             
             # Add skill to category
             categorized_skills[category].add(skill)
-        
+
+        return self._score_categorized_skills(categorized_skills)
+
+    def _score_categorized_skills(self, categorized_skills: Dict[str, set]) -> Dict[str, Dict]:
+        """
+        Score categorized skill sets and format the output dict.
+
+        Shared by the automaton and PhraseMatcher paths so both produce
+        the exact same structure.
+        """
         # Calculate scores and format output
         result = {}
         for category, skills in categorized_skills.items():
@@ -250,11 +332,16 @@ class NLPResumeAnalyzer:
             }
         
         return result
-    def extract_experience(self, text: str) -> List[Dict]:
+
+    def extract_experience(self, text: str, doc=None) -> List[Dict]:
         """
         Extract work experience entries from resume text.
+
+        Accepts an optional pre-parsed Doc so analyze_resume can share
+        one pipeline pass across extractions.
         """
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         experiences = []
         organizations = [ent.text for ent in doc.ents if ent.label_ == 'ORG']
         dates = [ent.text for ent in doc.ents if ent.label_ == 'DATE']
@@ -277,9 +364,12 @@ class NLPResumeAnalyzer:
             experiences.append(exp)
         return experiences
 
-    def extract_total_years_experience(self, text: str) -> float:
+    def extract_total_years_experience(self, text: str, doc=None) -> float:
         """
         Estimate total years of experience from resume text.
+
+        Accepts an optional pre-parsed Doc; the NER fallback reuses it
+        instead of running the pipeline again.
         """
         patterns = [
             r'(\d+)\+?\s*years?\s+(of\s+)?experience',
@@ -298,7 +388,8 @@ class NLPResumeAnalyzer:
                     years.append(int(m))
         if years:
             return float(max(years))
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         dates = [ent.text for ent in doc.ents if ent.label_ == 'DATE']
         year_pattern = r'(19|20)\d{2}'
         extracted_years = []
@@ -310,12 +401,16 @@ class NLPResumeAnalyzer:
             return float(min(max(span, 0), 40))
         return 0.0
 
-    def extract_education(self, text: str) -> List[Dict]:
+    def extract_education(self, text: str, doc=None) -> List[Dict]:
         """
         Extract detailed education information from resume text.
         Includes Degree, Field of Study, Institution, Timeline, and Grade.
+
+        Accepts an optional pre-parsed Doc so analyze_resume can share
+        one pipeline pass across extractions.
         """
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         education = []
         
         # Enhanced Degree + Field patterns
@@ -535,22 +630,42 @@ class NLPResumeAnalyzer:
         """
         Perform complete resume analysis.
         """
-        # Extract all components
-        skills = self.extract_skills(text)
-        experience = self.extract_experience(text)
-        education = self.extract_education(text)
-        
+        # Parse the resume (and job description, if any) in one batched
+        # pipeline pass: nlp.pipe amortizes per-call overhead, and every
+        # extraction below reuses the same parsed Doc instead of running
+        # the full pipeline once per component. The job description is
+        # only needed for skill matching, so when the automaton fast
+        # path handles that it is not parsed at all.
+        if job_description and self._skill_automaton is None:
+            texts = [text, job_description]
+        else:
+            texts = [text]
+        docs = list(self.nlp.pipe(texts))
+        doc = docs[0]
+
+        # Extract all components from the shared Doc (the automaton
+        # fast path, when available, scans the raw text instead)
+        if self._skill_automaton is not None:
+            skills = self._extract_skills_automaton(text.lower())
+        else:
+            skills = self._extract_skills_from_doc(doc)
+        experience = self.extract_experience(text, doc=doc)
+        education = self.extract_education(text, doc=doc)
+
         # New metrics
-        total_years_exp = self.extract_total_years_experience(text)
+        total_years_exp = self.extract_total_years_experience(text, doc=doc)
         edu_score = self.get_education_level_score(education)
-        
+
         # Calculate match score if job description provided
         match_score = 0
         missing_skills = []
-        
+
         if job_description:
-            job_skills = self.extract_skills(job_description)
-            
+            if self._skill_automaton is not None:
+                job_skills = self._extract_skills_automaton(job_description.lower())
+            else:
+                job_skills = self._extract_skills_from_doc(docs[1])
+
             # Find matching and missing skills
             resume_skills_flat = set()
             for cat_data in skills.values():
@@ -13,10 +13,33 @@ Each parser extracts text content while preserving
 structure as much as possible.
 """
 
+import io
 import os
 import re
 from typing import Optional, Tuple
 
+# Fused cleanup pattern for _clean_extracted_text: one scan handles
+# blank-line runs, line-edge/inner whitespace (incl. non-breaking
+# spaces) and problematic control characters, where the naive version
+# needed a full pass — and a full-size temporary string — per rule.
+_WS_CLASS = r'[ \t\xa0\x00-\x08\x0b-\x1f]'   # spaces, nbsp, control chars incl. \r
+_CLEAN_RE = re.compile(
+    _WS_CLASS + r'*\n(?:' + _WS_CLASS + r'*\n)+' + _WS_CLASS + r'*'  # blank-line runs -> '\n\n'
+    r'|' + _WS_CLASS + r'*\n' + _WS_CLASS + r'*'                     # newline + edge junk -> '\n'
+    r'|' + _WS_CLASS + r'+'                                          # inline runs -> ' ' (or '')
+)
+
+
+def _clean_repl(m: 're.Match') -> str:
+    token = m.group(0)
+    if '\n' in token:
+        return '\n\n' if token.count('\n') > 1 else '\n'
+    # Inline run: keep a single space if any real whitespace was present,
+    # drop the run entirely if it was control characters only
+    if ' ' in token or '\t' in token or '\xa0' in token:
+        return ' '
+    return ''
+
 
 def parse_resume_file(file_path: str) -> str:
     """
@@ -59,20 +82,53 @@ def parse_resume_file(file_path: str) -> str:
         raise ValueError(f"Unsupported file type: {ext}")
 
 
-def parse_pdf(file_path: str) -> str:
+def parse_resume_bytes(data: bytes, filename: str) -> str:
+    """
+    Parse resume content directly from in-memory bytes.
+
+    Avoids re-reading an uploaded file from disk when the request
+    handler already holds the bytes. Dispatches on the filename
+    extension just like parse_resume_file.
+
+    Args:
+        data: Raw file content
+        filename: Original filename (used for extension detection)
+
+    Returns:
+        str: Extracted text content
+
+    Raises:
+        ValueError: If the file type cannot be parsed from memory
+                    (legacy .doc requires a file on disk)
+    """
+    _, ext = os.path.splitext(filename)
+    ext = ext.lower()
+
+    if ext == '.pdf':
+        return parse_pdf(None, data=data)
+    elif ext == '.docx':
+        return parse_docx(None, data=data)
+    elif ext == '.txt':
+        return parse_txt(None, data=data)
+    else:
+        raise ValueError(f"Unsupported file type for in-memory parsing: {ext}")
+
+
+def parse_pdf(file_path: str, data: bytes = None) -> str:
     """
     Parse PDF file and extract text.
-    
+
     Uses PyPDF2 library to read PDF pages and extract text.
     Handles multi-page documents and attempts to preserve
     paragraph structure.
-    
+
     Args:
         file_path: Path to PDF file
-    
+        data: Optional raw PDF bytes; parsed in-memory when given
+
     Returns:
         str: Extracted text content
-    
+
     Example:
         text = parse_pdf('/uploads/resume.pdf')
     """
@@ -80,7 +136,10 @@ def parse_pdf(file_path: str) -> str:
         # 1. New Primary Engine: PyMuPDF (fitz) - Extremely robust and fast
         try:
             import fitz
-            doc = fitz.open(file_path)
+            if data is not None:
+                doc = fitz.open(stream=data, filetype='pdf')
+            else:
+                doc = fitz.open(file_path)
             text_parts = []
             has_images = False
             
@@ -136,7 +195,7 @@ def parse_pdf(file_path: str) -> str:
         # 2. Secondary Engine: pdfminer.six
         try:
             from pdfminer.high_level import extract_text as miner_extract
-            full_text = miner_extract(file_path)
+            full_text = miner_extract(io.BytesIO(data) if data is not None else file_path)
             if full_text and len(full_text.strip()) > 50:
                 print(f"DEBUG: Success extracting with pdfminer.six ({len(full_text)} chars)")
                 return _clean_extracted_text(full_text)
@@ -146,7 +205,7 @@ def parse_pdf(file_path: str) -> str:
         # 3. Third Engine: pdfplumber
         try:
             import pdfplumber
-            with pdfplumber.open(file_path) as pdf:
+            with pdfplumber.open(io.BytesIO(data) if data is not None else file_path) as pdf:
                 text_parts = []
                 for page in pdf.pages:
                     t = page.extract_text()
@@ -162,7 +221,7 @@ def parse_pdf(file_path: str) -> str:
         # 4. Fourth Engine: pypdf
         try:
             from pypdf import PdfReader
-            reader = PdfReader(file_path)
+            reader = PdfReader(io.BytesIO(data) if data is not None else file_path)
             text_parts = []
             for page in reader.pages:
                 t = page.extract_text(extraction_mode="layout")
@@ -184,13 +243,13 @@ def parse_pdf(file_path: str) -> str:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
 
 
-def parse_docx(file_path: str) -> str:
+def parse_docx(file_path: str, data: bytes = None) -> str:
     """
     Parse DOCX file and extract text.
     """
     try:
         from docx import Document
-        doc = Document(file_path)
+        doc = Document(io.BytesIO(data) if data is not None else file_path)
         text_parts = []
         
         # Extract paragraphs
@@ -232,17 +291,20 @@ def parse_doc(file_path: str) -> str:
         raise ValueError(f"Legcy DOC parsing failed. Please convert to DOCX or PDF. Detail: {str(e)}")
 
 
-def parse_txt(file_path: str) -> str:
+def parse_txt(file_path: str, data: bytes = None) -> str:
     """
     Parse plain text file with multiple encoding attempts.
     """
     encodings = ['utf-8', 'latin-1', 'cp1252', 'utf-16']
     for enc in encodings:
         try:
-            with open(file_path, 'r', encoding=enc) as f:
-                content = f.read()
-                if content:
-                    return _clean_extracted_text(content)
+            if data is not None:
+                content = data.decode(enc)
+            else:
+                with open(file_path, 'r', encoding=enc) as f:
+                    content = f.read()
+            if content:
+                return _clean_extracted_text(content)
         except Exception:
             continue
     raise ValueError("Could not read text file with any standard encoding")
@@ -266,25 +328,10 @@ def _clean_extracted_text(text: str) -> str:
     """
     if not text:
         return ""
-    # Replace non-breaking spaces with standard spaces
-    text = text.replace('\xa0', ' ')
-    
-    # Replace multiple spaces with single space
-    text = re.sub(r'[ \t]+', ' ', text)
-    
-    # Replace multiple newlines with double newline
-    text = re.sub(r'\n\s*\n', '\n\n', text)
-    
-    # Remove leading/trailing whitespace from lines
-    lines = [line.strip() for line in text.split('\n')]
-    text = '\n'.join(lines)
-    
-    # Remove only problematic control characters (like null bytes) but keep others
-    # and all unicode. This is safer than a whitelist.
-    bad_chars = '\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
-    text = "".join(ch for ch in text if ch not in bad_chars)
-    
-    return text.strip()
+    # Single fused pass: the old implementation walked the full text five
+    # times (replace, two re.sub, split/join, char filter), materializing
+    # a new full-size string each time
+    return _CLEAN_RE.sub(_clean_repl, text).strip()
 
 
 def get_file_info(file_path: str) -> dict: